@@ -1,7 +1,19 @@
+import os
 import time
 import random
+import numpy as np
 from trainalert import TrainingNotifier
 
+# Scale simulated training time; set TRAINALERT_DEMO_SLEEP=0 to skip the
+# sleeps entirely, e.g. when benchmarking the notifier itself
+_SLEEP_SCALE = float(os.environ.get("TRAINALERT_DEMO_SLEEP", "1"))
+
+
+def _sleep(seconds):
+    """Sleep for a scaled amount of simulated training time."""
+    if _SLEEP_SCALE:
+        time.sleep(seconds * _SLEEP_SCALE)
+
 
 def example_multi_channel():
     """Example: Send notifications to multiple channels."""
@@ -24,7 +36,7 @@ def example_multi_channel():
     for epoch in range(1, 11):
         loss = 2.0 * (0.9 ** epoch)
         notifier.log_metric("loss", loss, epoch=epoch)
-        time.sleep(0.5)
+        _sleep(0.5)
     
     notifier.training_complete()
 
@@ -59,7 +71,7 @@ def example_custom_checkpoints():
                 }
             )
         
-        time.sleep(0.3)
+        _sleep(0.3)
     
     notifier.training_complete()
 
@@ -85,7 +97,7 @@ def example_error_handling():
             if epoch == 5:
                 raise ValueError("Simulated training error: NaN loss detected!")
             
-            time.sleep(0.3)
+            _sleep(0.3)
         
         notifier.training_complete()
         
@@ -111,24 +123,26 @@ def example_train_val_split():
         "val_size": 2000
     })
     
-    for epoch in range(1, 21):
-        # Training metrics
-        train_loss = 2.0 * (0.9 ** epoch) + random.uniform(-0.05, 0.05)
-        train_acc = min(0.95, 0.6 + (epoch * 0.02)) + random.uniform(-0.02, 0.02)
-        
-        # Validation metrics (typically worse than training)
-        val_loss = train_loss + random.uniform(0.1, 0.3)
-        val_acc = train_acc - random.uniform(0.02, 0.08)
-        
+    # Precompute simulated metrics for all epochs
+    rng = np.random.default_rng(0)
+    epochs = np.arange(1, 21)
+    train_loss = 2.0 * (0.9 ** epochs) + rng.uniform(-0.05, 0.05, size=epochs.size)
+    train_acc = np.minimum(0.95, 0.6 + epochs * 0.02) + rng.uniform(-0.02, 0.02, size=epochs.size)
+    
+    # Validation metrics (typically worse than training)
+    val_loss = train_loss + rng.uniform(0.1, 0.3, size=epochs.size)
+    val_acc = train_acc - rng.uniform(0.02, 0.08, size=epochs.size)
+    
+    for i, epoch in enumerate(epochs):
         # Log all metrics
         notifier.log_metrics({
-            "train_loss": train_loss,
-            "train_accuracy": train_acc,
-            "val_loss": val_loss,
-            "val_accuracy": val_acc
-        }, epoch=epoch)
+            "train_loss": train_loss[i],
+            "train_accuracy": train_acc[i],
+            "val_loss": val_loss[i],
+            "val_accuracy": val_acc[i]
+        }, epoch=int(epoch))
         
-        time.sleep(0.3)
+        _sleep(0.3)
     
     notifier.training_complete(final_metrics={
         "best_val_accuracy": 0.89,
@@ -152,17 +166,18 @@ def example_learning_rate_schedule():
         "lr_schedule": "cosine_annealing"
     })
     
-    for epoch in range(1, 51):
-        # Simulate cosine annealing LR schedule
-        lr = initial_lr * (1 + np.cos(epoch * np.pi / 50)) / 2
-        loss = 2.0 * (0.95 ** epoch)
-        
+    # Simulate cosine annealing LR schedule for all epochs up front
+    epochs = np.arange(1, 51)
+    lrs = initial_lr * (1 + np.cos(epochs * np.pi / 50)) / 2
+    losses = 2.0 * (0.95 ** epochs)
+    
+    for i, epoch in enumerate(epochs):
         notifier.log_metrics({
-            "loss": loss,
-            "learning_rate": lr
-        }, epoch=epoch)
+            "loss": losses[i],
+            "learning_rate": lrs[i]
+        }, epoch=int(epoch))
         
-        time.sleep(0.2)
+        _sleep(0.2)
     
     notifier.training_complete()
 
@@ -186,7 +201,7 @@ def example_minimal_notifications():
     for epoch in range(1, 101):
         loss = 2.0 * (0.95 ** epoch)
         notifier.log_metric("loss", loss, epoch=epoch)
-        time.sleep(0.1)
+        _sleep(0.1)
     
     # Only get notification at the end
     notifier.training_complete()
@@ -215,16 +230,14 @@ def example_multiple_experiments():
         for epoch in range(1, 11):
             loss = 2.0 * (0.9 ** epoch) * (1 + random.uniform(-0.1, 0.1))
             notifier.log_metric("loss", loss, epoch=epoch)
-            time.sleep(0.2)
+            _sleep(0.2)
         
         notifier.training_complete()
         print(f"Completed {exp['name']}")
-        time.sleep(1)
+        _sleep(1)
 
 
 if __name__ == "__main__":
-    import numpy as np
-    
     print("TrainAlert Advanced Usage Examples")
     print("=" * 50)
     
@@ -1,8 +1,19 @@
 """Basic usage example for TrainAlert."""
+import os
 import time
 import random
 from trainalert import TrainingNotifier
 
+# Scale simulated training time; set TRAINALERT_DEMO_SLEEP=0 to skip the
+# sleeps entirely, e.g. when benchmarking the notifier itself
+_SLEEP_SCALE = float(os.environ.get("TRAINALERT_DEMO_SLEEP", "1"))
+
+
+def _sleep(seconds):
+    """Sleep for a scaled amount of simulated training time."""
+    if _SLEEP_SCALE:
+        time.sleep(seconds * _SLEEP_SCALE)
+
 def main():
     """Demonstrate basic usage of TrainAlert."""
     
@@ -24,32 +35,27 @@ def main():
         "optimizer": "Adam"
     })
     
-    # Simulate training loop
-    print("Starting training...")
-    for epoch in range(1, 21):
+    # Simulate training for one epoch and return its metrics
+    def train_epoch(epoch):
         print(f"Epoch {epoch}/20")
         
         # Simulate training
-        time.sleep(1)
+        _sleep(1)
         
         # Generate fake metrics
         loss = 2.0 * (0.9 ** epoch) + random.uniform(-0.1, 0.1)
         accuracy = min(0.95, 0.5 + (epoch * 0.025) + random.uniform(-0.02, 0.02))
-        
-        # Log metrics
-        notifier.log_metric("loss", loss, epoch=epoch)
-        notifier.log_metric("accuracy", accuracy, epoch=epoch)
-        
-        # Or log multiple metrics at once
-        # notifier.log_metrics({
-        #     "loss": loss,
-        #     "accuracy": accuracy
-        # }, epoch=epoch)
+        return {"loss": loss, "accuracy": accuracy}
+    
+    # Run the training loop; metrics are logged for every epoch
+    # (or call notifier.log_metric / log_metrics from your own loop)
+    print("Starting training...")
+    final = notifier.run(20, train_epoch)
     
     # Training complete
     notifier.training_complete(final_metrics={
-        "final_loss": loss,
-        "final_accuracy": accuracy,
+        "final_loss": final["loss"],
+        "final_accuracy": final["accuracy"],
         "best_accuracy": 0.95
     })
     
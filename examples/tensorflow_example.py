@@ -21,16 +21,12 @@ class TrainAlertCallback(keras.callbacks.Callback):
     def __init__(self, notifier):
         super().__init__()
         self.notifier = notifier
+        self._log_metrics = notifier.log_metrics
     
     def on_epoch_end(self, epoch, logs=None):
-        """Log metrics at end of each epoch."""
+        """Log every metric Keras reports (loss, accuracy, val_*, ...) at end of each epoch."""
         if logs:
-            self.notifier.log_metrics({
-                "train_loss": logs.get('loss', 0),
-                "train_accuracy": logs.get('accuracy', 0),
-                "val_loss": logs.get('val_loss', 0),
-                "val_accuracy": logs.get('val_accuracy', 0)
-            }, epoch=epoch + 1)
+            self._log_metrics(logs, epoch=epoch + 1)
 
 
 def create_model():
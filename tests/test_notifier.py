@@ -2,6 +2,19 @@
 import pytest
 from trainalert import TrainingNotifier
 from trainalert.utils.metrics import MetricTracker
+from trainalert.notifiers.base import BaseNotifier
+
+
+class RecordingNotifier(BaseNotifier):
+    """Notifier that records messages instead of sending them."""
+    
+    def __init__(self):
+        super().__init__({})
+        self.sent = []
+    
+    def send_message(self, subject, message, attachments=None, **kwargs):
+        self.sent.append(subject)
+        return True
 
 
 def test_metric_tracker():
@@ -23,6 +36,23 @@ def test_metric_tracker():
     best = tracker.get_best("loss")
     assert best["value"] == 0.6
     assert best["epoch"] == 3
+    assert best["index"] == 2
+
+
+def test_metric_tracker_rejects_non_numeric_values():
+    """Test non-numeric values raise a TypeError naming the metric."""
+    import numpy as np
+    
+    tracker = MetricTracker()
+    tracker.log("loss", np.float32(0.5), epoch=1)
+    
+    with pytest.raises(TypeError, match="'loss'.*str"):
+        tracker.log("loss", "n/a", epoch=2)
+    with pytest.raises(TypeError, match="'loss'.*NoneType"):
+        tracker.log("loss", None, epoch=2)
+    
+    assert tracker.get_all("loss") == [0.5]
+    assert tracker.epochs == [1]
 
 
 def test_metric_tracker_improvement():
@@ -40,6 +70,89 @@ def test_metric_tracker_improvement():
     # Worse accuracy - should not improve
     tracker.log("accuracy", 0.75, epoch=3)
     assert tracker.check_improvement("accuracy") is False
+    
+    # Lower is better for error metrics
+    tracker.log("val_error", 0.3, epoch=1)
+    tracker.log("val_error", 0.2, epoch=2)
+    assert tracker.is_loss("val_error") is True
+    assert tracker.is_loss("accuracy") is False
+    assert tracker.check_improvement("val_error") is True
+    
+    # Formatting and plotting fall back to the same rule as the tracker
+    from trainalert.utils.formatting import MessageFormatter
+    from trainalert.visualizers.plots import PlotGenerator
+    
+    assert MessageFormatter.format_improvement("val_error", 0.3, 0.2, 2).startswith("📉")
+    assert MessageFormatter.format_improvement("accuracy", 0.7, 0.8, 2).startswith("📈")
+    errors = [0.3, 0.2, 0.25]
+    assert (
+        PlotGenerator.create_metric_plot("val_error", errors, figsize=(4, 3)).getvalue()
+        == PlotGenerator.create_metric_plot("val_error", errors, figsize=(4, 3), best_idx=1).getvalue()
+    )
+
+
+def test_metric_tracker_without_best_tracking():
+    """Test best tracking can be skipped per log call."""
+    tracker = MetricTracker()
+    
+    tracker.log("learning_rate", 0.01, epoch=1, track_best=False)
+    
+    assert tracker.get_latest("learning_rate") == 0.01
+    assert tracker.get_best("learning_rate") is None
+    assert tracker.check_improvement("learning_rate") is False
+
+
+def test_metric_tracker_grows_storage():
+    """Test metric storage grows past its initial capacity."""
+    tracker = MetricTracker()
+    
+    for step in range(1000):
+        tracker.log("loss", 1.0 / (step + 1))
+    
+    assert len(tracker.get_all("loss")) == 1000
+    assert tracker.get_array("loss")[0] == 1.0
+    assert tracker.get_latest("loss") == 1.0 / 1000
+    assert tracker.get_best("loss")["value"] == 1.0 / 1000
+    assert len(tracker.timestamps) == 1000
+    assert (tracker.timestamps[1:] >= tracker.timestamps[:-1]).all()
+    
+    preallocated = MetricTracker(initial_capacity=1)
+    for step in range(5):
+        preallocated.log("loss", float(step))
+    assert preallocated.get_all("loss") == [0.0, 1.0, 2.0, 3.0, 4.0]
+    
+    preallocated.reserve(100)
+    assert len(preallocated._values["loss"]) == 105
+    assert preallocated.get_all("loss") == [0.0, 1.0, 2.0, 3.0, 4.0]
+    
+    notifier = TrainingNotifier(training_name="Test", initial_capacity=500)
+    assert len(notifier.metric_tracker._timestamps) == 500
+    notifier.log_metric("loss", 1.0)
+    assert len(notifier.metric_tracker._values["loss"]) == 500
+
+
+def test_metric_tracker_history_file(tmp_path):
+    """Test logged values are appended to the on-disk history."""
+    path = str(tmp_path / "history.bin")
+    tracker = MetricTracker(history_path=path)
+    
+    tracker.log("loss", 1.0, epoch=1)
+    tracker.log("accuracy", 0.5, epoch=1)
+    tracker.log("loss", 0.8)
+    tracker.close()
+    
+    history = MetricTracker.read_history(path)
+    assert history["loss"]["values"].tolist() == [1.0, 0.8]
+    assert history["loss"]["epochs"].tolist() == [1, -1]
+    assert history["accuracy"]["values"].tolist() == [0.5]
+    
+    # Reusing the path starts a new history, closed when training completes
+    notifier = TrainingNotifier(training_name="Test", history_path=path)
+    notifier.log_metric("loss", 0.5, epoch=1)
+    notifier.training_complete()
+    assert notifier.metric_tracker._history is None
+    assert list(MetricTracker.read_history(path)) == ["loss"]
+    assert MetricTracker.read_history(path)["loss"]["values"].tolist() == [0.5]
 
 
 def test_training_notifier_init():
@@ -54,6 +167,24 @@ def test_training_notifier_init():
     assert notifier.metric_tracker is not None
 
 
+def test_status_logging_started_lazily():
+    """Test importing the package starts no threads and keeps propagation."""
+    import subprocess
+    import sys
+    
+    script = (
+        "import threading, logging, trainalert\n"
+        "assert threading.active_count() == 1\n"
+        "assert logging.getLogger('trainalert').propagate\n"
+        "trainalert.TrainingNotifier(training_name='Test')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert "TrainAlert initialized for 'Test'" in result.stdout
+
+
 def test_log_metric():
     """Test logging single metric."""
     notifier = TrainingNotifier(training_name="Test")
@@ -80,6 +211,108 @@ def test_log_multiple_metrics():
     assert notifier.metric_tracker.get_latest("precision") == 0.82
 
 
+def test_log_metrics_sends_only_checkpoints():
+    """Test log_metrics sends periodic checkpoints but no improvement alerts."""
+    notifier = TrainingNotifier(
+        training_name="Test",
+        notify_every_n_epochs=5,
+        include_plots=False,
+        include_system_info=False
+    )
+    recorder = RecordingNotifier()
+    notifier.notifiers = [recorder]
+    
+    for epoch in range(1, 6):
+        notifier.log_metrics({"loss": 1.0 / epoch, "learning_rate": 0.1 / epoch}, epoch=epoch)
+    notifier.flush()
+    
+    assert recorder.sent == ["📍 Test - Checkpoint"]
+
+
+def test_step_metrics_checked_every_buffer_size_steps():
+    """Test metrics logged without epochs are checked in batches."""
+    notifier = TrainingNotifier(
+        training_name="Test",
+        include_plots=False,
+        include_system_info=False,
+        metric_buffer_size=3
+    )
+    recorder = RecordingNotifier()
+    notifier.notifiers = [recorder]
+    
+    for step in range(1, 6):
+        notifier.log_metric("loss", 1.0 / step)
+    notifier.flush()
+    
+    # Only the third step triggered a check; steps 4-5 are still buffered
+    assert recorder.sent == ["📈 Loss Improved!"]
+    assert notifier.metric_tracker.get_latest("loss") == 1.0 / 5
+    
+    notifier.flush_metrics()
+    notifier.flush()
+    assert recorder.sent == ["📈 Loss Improved!", "📈 Loss Improved!"]
+
+
+def test_plots_reused_when_metrics_unchanged():
+    """Test plots are only re-rendered when metric data changes."""
+    notifier = TrainingNotifier(training_name="Test")
+    notifier.log_metrics({"loss": 1.0, "accuracy": 0.5}, epoch=1)
+    
+    first = notifier._generate_plots()
+    second = notifier._generate_plots()
+    assert first[0] is second[0]
+    assert first[0].startswith(b"\x89PNG")
+    assert len(notifier._plot_cache) == 1
+    
+    notifier.log_metrics({"loss": 0.8, "accuracy": 0.6}, epoch=2)
+    notifier._generate_plots()
+    assert len(notifier._plot_cache) == 2
+
+
+def test_plot_figures_reused_between_renders():
+    """Test reused figures render the same image as a fresh figure."""
+    from trainalert.visualizers.plots import PlotGenerator
+    
+    first = PlotGenerator.create_metric_plot("loss", [1.0, 0.5, 0.25], figsize=(4, 3))
+    fig, _ = PlotGenerator._get_figure('metric', (4, 3))
+    second = PlotGenerator.create_metric_plot("loss", [1.0, 0.5, 0.25], figsize=(4, 3))
+    
+    assert PlotGenerator._get_figure('metric', (4, 3))[0] is fig
+    assert first.getvalue() == second.getvalue()
+    
+    # An overview of the same size must not leave its suptitle behind
+    PlotGenerator.create_multi_metric_plot({"loss": [1.0, 0.5]}, figsize=(4, 3))
+    third = PlotGenerator.create_metric_plot("loss", [1.0, 0.5, 0.25], figsize=(4, 3))
+    assert third.getvalue() == first.getvalue()
+
+
+def test_long_series_downsampled_for_drawing():
+    """Test long series are decimated but keep their endpoints."""
+    import numpy as np
+    from trainalert.visualizers.plots import _downsample
+    
+    values = np.arange(10001, dtype=float)
+    x, y = _downsample(np.arange(10001), values, target=1000)
+    
+    assert len(y) <= 1002
+    assert (x[0], x[-1]) == (0, 10000)
+    assert (y[0], y[-1]) == (0.0, 10000.0)
+    assert _downsample([0, 1], [1.0, 2.0]) == ([0, 1], [1.0, 2.0])
+
+
+def test_run_logs_each_epoch():
+    """Test the run helper logs metrics returned by each step."""
+    notifier = TrainingNotifier(training_name="Test", notify_on_improvement=False)
+    
+    final = notifier.run(300, lambda epoch: {"loss": 1.0 / epoch})
+    
+    assert final == {"loss": 1.0 / 300}
+    # Storage was sized from the epoch count up front
+    assert len(notifier.metric_tracker._values["loss"]) == 300
+    assert notifier.metric_tracker.get_all("loss")[:3] == [1.0, 0.5, 1.0 / 3]
+    assert notifier.metric_tracker.epochs == list(range(1, 301))
+
+
 def test_get_summary():
     """Test getting training summary."""
     notifier = TrainingNotifier(training_name="Test")
@@ -94,5 +327,258 @@ def test_get_summary():
     assert "loss" in summary["metrics"]
 
 
+def test_html_email_escapes_content():
+    """Test the HTML email template escapes text and adds optional sections."""
+    from trainalert.utils.formatting import MessageFormatter
+    
+    html = MessageFormatter.create_html_email(
+        "Error", "line 1\nin <module>", system_info="CPU: 4", plot_count=2
+    )
+    
+    assert "line 1<br>in &lt;module&gt;" in html
+    assert "System Information:" in html
+    assert 'src="cid:plot1"' in html
+    assert "System Information:" not in MessageFormatter.create_html_email("A", "b")
+
+
+def test_training_complete_message_handles_missing_values():
+    """Test the completion summary tolerates metrics without a latest value."""
+    from trainalert.utils.formatting import MessageFormatter
+    
+    message = MessageFormatter.format_training_complete(
+        "Test",
+        {"metrics": {"loss": {"best": 0.1, "best_epoch": 3}, "acc": {"latest": 0.9}}},
+        {"lr": 0.001}
+    )
+    
+    assert "    Latest: N/A\n    Best: 0.100000 (epoch 3)" in message
+    assert "    Latest: 0.900000" in message
+    assert message.endswith("Final Metrics:\n  lr: 0.001000")
+
+
+def test_webhook_session_is_shared():
+    """Test webhook notifiers reuse one pooled HTTP session."""
+    from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+    from trainalert.notifiers.base import get_session, RETRY_STATUSES
+    
+    assert get_session() is get_session()
+    
+    retries = get_session().get_adapter("https://hooks.slack.com").max_retries
+    assert retries.is_retry("POST", 429)
+    assert not retries.is_retry("POST", 400)
+    assert set(retries.status_forcelist) == set(RETRY_STATUSES)
+    
+    # A POST that timed out reading the response may have been delivered
+    assert retries.read == 0
+    with pytest.raises(MaxRetryError):
+        retries.increment("POST", "/", error=ReadTimeoutError(None, "/", "timed out"))
+
+
+def test_gpu_info_tolerates_unreported_fields(monkeypatch):
+    """Test nvidia-smi "[N/A]" readings become None instead of an error."""
+    import subprocess
+    from trainalert.utils import system
+    
+    output = (
+        "0, Tesla T4, 15360, 1024, 14336, 12, 40\n"
+        "1, MIG Device, [N/A], [N/A], [N/A], [N/A], [N/A]\n"
+    )
+    monkeypatch.setattr(system, "GPU_AVAILABLE", True)
+    monkeypatch.setattr(system, "NVIDIA_SMI", "nvidia-smi")
+    monkeypatch.setattr(
+        subprocess, "run",
+        lambda args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=output)
+    )
+    
+    gpus = system.SystemInfo.get_gpu_info()
+    assert gpus[0]["memory_util"] == 1024 / 15360 * 100
+    assert gpus[0]["temperature"] == 40.0
+    assert gpus[1]["name"] == "MIG Device"
+    assert all(
+        gpus[1][key] is None
+        for key in ("memory_total_mb", "memory_used_mb", "memory_free_mb",
+                    "memory_util", "gpu_util", "temperature")
+    )
+    
+    formatted = system.SystemInfo.format_system_info()
+    assert "Memory: N/A / N/A (N/A)" in formatted
+    assert "Utilization: 12.0%" in formatted
+
+
+def test_slack_payload_template():
+    """Test the pre-serialized Slack payload decodes to the expected blocks."""
+    import json
+    from trainalert.notifiers.slack import _build_payload
+    
+    payload = json.loads(_build_payload('Loss "improved"', "epoch 1\nloss 0.5"))
+    
+    assert payload["blocks"][0]["text"]["text"] == 'Loss "improved"'
+    assert payload["blocks"][1]["text"]["text"] == "```epoch 1\nloss 0.5```"
+
+
+def test_send_message_async():
+    """Test notifiers can be awaited from async code."""
+    import asyncio
+    
+    recorder = RecordingNotifier()
+    
+    async def send_both():
+        return await asyncio.gather(
+            recorder.send_message_async("First", "a"),
+            recorder.send_message_async("Second", "b"),
+        )
+    
+    assert asyncio.run(send_both()) == [True, True]
+    assert sorted(recorder.sent) == ["First", "Second"]
+
+
+def test_notifications_delivered_in_background():
+    """Test queued notifications are delivered by the worker thread."""
+    notifier = TrainingNotifier(
+        training_name="Test", include_plots=False, include_system_info=False
+    )
+    recorder = RecordingNotifier()
+    notifier.notifiers = [recorder]
+    
+    notifier.checkpoint("Halfway")
+    notifier.flush()
+    assert recorder.sent == ["📍 Test - Checkpoint"]
+    
+    notifier.training_complete()
+    assert len(recorder.sent) == 2
+    assert notifier._worker is None
+
+
+def test_discord_payload_truncates_long_messages():
+    """Test long messages are cut to fit a Discord embed."""
+    import json
+    from trainalert.notifiers.base import Notification
+    from trainalert.notifiers.discord import _build_payload
+    
+    payload = _build_payload([Notification("Done", "x" * 2000)])
+    embed = json.loads(payload)["embeds"][0]
+    assert embed["title"] == "Done"
+    assert embed["description"].endswith("... (truncated)\n```")
+
+
+def test_notifications_sent_together_are_batched():
+    """Test notifications queued together reach notifiers as one batch."""
+    import json
+    from trainalert.notifiers.base import Notification
+    from trainalert.notifiers.discord import _split_batch
+    from trainalert.notifiers.slack import _build_batch_payload
+    
+    class BatchRecorder(RecordingNotifier):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+        
+        def send_batch(self, notifications):
+            self.batches.append([n.subject for n in notifications])
+            return True
+    
+    notifier = TrainingNotifier(
+        training_name="Test", include_plots=False, include_system_info=False
+    )
+    recorder = BatchRecorder()
+    notifier.notifiers = [recorder]
+    
+    # Queue both before the worker exists so it dequeues them together
+    notifier._queue.put(Notification("First", "a"))
+    notifier._queue.put(Notification("Second", "b"))
+    notifier._start_worker()
+    notifier.flush()
+    assert recorder.batches == [["First", "Second"]]
+    assert recorder.sent == []
+    notifier._stop_worker()
+    
+    # Discord starts a new message before exceeding 10 files or 6000 characters
+    plots = [Notification(f"Epoch {i}", "x", [b"png"] * 6) for i in range(2)]
+    assert [len(c) for c in _split_batch(plots)] == [1, 1]
+    long = [Notification(f"Long {i}", "x" * 1900) for i in range(4)]
+    assert [len(c) for c in _split_batch(long)] == [3, 1]
+    short = [Notification(f"Short {i}", "x") for i in range(12)]
+    assert [len(c) for c in _split_batch(short)] == [10, 2]
+    
+    payload = json.loads(_build_batch_payload([
+        Notification("First", "a"), Notification("Second", "b")
+    ]))
+    assert [b["type"] for b in payload["blocks"]] == ["header", "section"] * 2
+    assert payload["blocks"][2]["text"]["text"] == "Second"
+
+
+def test_queued_notifications_delivered_at_exit(tmp_path):
+    """Test notifications still queued when the script ends are delivered."""
+    import subprocess
+    import sys
+    import textwrap
+    
+    sent = tmp_path / "sent.txt"
+    script = textwrap.dedent(f"""
+        from trainalert import TrainingNotifier
+        from trainalert.notifiers.base import BaseNotifier
+        
+        class FileNotifier(BaseNotifier):
+            def send_message(self, subject, message, attachments=None, **kwargs):
+                with open({str(sent)!r}, "a", encoding="utf-8") as f:
+                    f.write(subject + "\\n")
+                return True
+        
+        notifier = TrainingNotifier(
+            training_name="Test", include_plots=False, include_system_info=False
+        )
+        notifier.notifiers = [FileNotifier({{}}), FileNotifier({{}})]
+        notifier.checkpoint("Last one")
+    """)
+    
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
+    
+    assert sent.read_text(encoding="utf-8").splitlines() == ["📍 Test - Checkpoint"] * 2
+
+
+def test_notifications_fan_out_to_all_channels():
+    """Test each enabled notifier receives the notification."""
+    notifier = TrainingNotifier(
+        training_name="Test", include_plots=False, include_system_info=False
+    )
+    recorders = [RecordingNotifier(), RecordingNotifier(), RecordingNotifier()]
+    recorders[2].disable()
+    notifier.notifiers = recorders
+    
+    notifier.checkpoint("Halfway")
+    notifier.flush()
+    
+    assert recorders[0].sent == ["📍 Test - Checkpoint"]
+    assert recorders[1].sent == ["📍 Test - Checkpoint"]
+    assert recorders[2].sent == []
+
+
+def test_epoch_notifications_sent_once_per_epoch():
+    """Test metrics are checked once per epoch rather than once per call."""
+    notifier = TrainingNotifier(
+        training_name="Test",
+        notify_every_n_epochs=2,
+        include_plots=False,
+        include_system_info=False
+    )
+    recorder = RecordingNotifier()
+    notifier.notifiers = [recorder]
+    
+    for epoch in range(1, 3):
+        notifier.log_metric("loss", 1.0 / epoch, epoch=epoch)
+        notifier.log_metric("accuracy", 0.5 * epoch, epoch=epoch)
+    notifier.flush()
+    
+    # Epoch 2 is only finalized once the run completes
+    assert recorder.sent == []
+    
+    notifier.training_complete()
+    assert recorder.sent == [
+        "📈 2 Metrics Improved!",
+        "📍 Test - Checkpoint",
+        "✅ Test - Complete!",
+    ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
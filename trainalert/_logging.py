@@ -0,0 +1,39 @@
+"""Status logging for TrainAlert."""
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from typing import Optional
+
+logger = logging.getLogger("trainalert")
+logger.setLevel(logging.INFO)
+
+# Records are handed to a background listener so notifier threads never block
+# on writing to the console
+_listener: Optional[logging.handlers.QueueListener] = None
+_lock = threading.Lock()
+
+
+def start_logging():
+    """
+    Start printing status messages, if not already started.
+    
+    Called when the first TrainingNotifier is created, so importing the
+    package starts no threads. Records also propagate to the root logger;
+    set ``logging.getLogger("trainalert").propagate = False`` to avoid
+    seeing them twice when the root logger has its own handlers.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter("%(message)s"))
+        _listener = logging.handlers.QueueListener(records, console)
+        logger.addHandler(logging.handlers.QueueHandler(records))
+        _listener.start()
+        # Stopping the listener writes out any records still queued
+        atexit.register(_listener.stop)
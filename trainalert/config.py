@@ -1,15 +1,46 @@
 """Configuration management for TrainAlert."""
 import os
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
-# Load environment variables
-load_dotenv()
+# Environment variables mapped to configuration keys
+ENV_MAPPINGS = {
+    'EMAIL_ADDRESS': 'email_address',
+    'EMAIL_PASSWORD': 'email_password',
+    'SMTP_SERVER': 'smtp_server',
+    'SMTP_PORT': 'smtp_port',
+    'SLACK_WEBHOOK_URL': 'slack_webhook_url',
+    'DISCORD_WEBHOOK_URL': 'discord_webhook_url',
+}
+
+# Load environment variables from .env, unless they are all already set
+if not all(os.environ.get(env_key) for env_key in ENV_MAPPINGS):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _read_env() -> Dict[str, Any]:
+    """Read configuration values from environment variables."""
+    values = {}
+    for env_key, config_key in ENV_MAPPINGS.items():
+        value = os.getenv(env_key)
+        if value:
+            # Convert port to int if applicable
+            if config_key == 'smtp_port':
+                value = int(value)
+            values[config_key] = value
+    return values
+
+
+# Environment is read once at import rather than on every Config()
+_ENV_CACHE = _read_env()
 
 
 class Config:
     """Configuration class for TrainAlert."""
     
+    __slots__ = ("config",)
+    
     def __init__(self, config_dict: Optional[Dict[str, Any]] = None):
         """
         Initialize configuration.
@@ -22,22 +53,8 @@ class Config:
     
     def _load_from_env(self):
         """Load configuration from environment variables."""
-        env_mappings = {
-            'EMAIL_ADDRESS': 'email_address',
-            'EMAIL_PASSWORD': 'email_password',
-            'SMTP_SERVER': 'smtp_server',
-            'SMTP_PORT': 'smtp_port',
-            'SLACK_WEBHOOK_URL': 'slack_webhook_url',
-            'DISCORD_WEBHOOK_URL': 'discord_webhook_url',
-        }
-        
-        for env_key, config_key in env_mappings.items():
-            value = os.getenv(env_key)
-            if value and config_key not in self.config:
-                # Convert port to int if applicable
-                if config_key == 'smtp_port':
-                    value = int(value)
-                self.config[config_key] = value
+        for config_key, value in _ENV_CACHE.items():
+            self.config.setdefault(config_key, value)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
@@ -50,20 +67,31 @@ class Config:
     def update(self, config_dict: Dict[str, Any]):
         """Update configuration with dictionary."""
         self.config.update(config_dict)
+    
+    def freeze(self) -> Mapping[str, Any]:
+        """
+        Get a read-only snapshot of the current configuration.
+        
+        Later set/update calls do not affect the snapshot.
+        
+        Returns:
+            Immutable mapping of configuration values
+        """
+        return MappingProxyType(dict(self.config))
 
 
 # Default SMTP configurations for common providers
-SMTP_CONFIGS = {
-    'gmail': {
+SMTP_CONFIGS = MappingProxyType({
+    'gmail': MappingProxyType({
         'smtp_server': 'smtp.gmail.com',
         'smtp_port': 587,
-    },
-    'outlook': {
+    }),
+    'outlook': MappingProxyType({
         'smtp_server': 'smtp-mail.outlook.com',
         'smtp_port': 587,
-    },
-    'yahoo': {
+    }),
+    'yahoo': MappingProxyType({
         'smtp_server': 'smtp.mail.yahoo.com',
         'smtp_port': 587,
-    },
-}
\ No newline at end of file
+    }),
+})
@@ -1,16 +1,55 @@
 """Core TrainingNotifier class."""
+import atexit
+import functools
+import io
+import queue
+import threading
+import time
 import traceback
-from typing import Dict, Any, Optional, List, Union
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Any, Mapping, Optional, List, Union
 from datetime import datetime
 
 from .config import Config, SMTP_CONFIGS
-from .utils.metrics import MetricTracker
+from .utils.metrics import MetricTracker, INITIAL_CAPACITY
 from .utils.system import SystemInfo
 from .utils.formatting import MessageFormatter
-from .visualizers.plots import PlotGenerator
-from .notifiers.email import EmailNotifier
-from .notifiers.slack import SlackNotifier
-from .notifiers.discord import DiscordNotifier
+from .notifiers.base import BaseNotifier, Notification
+from ._logging import logger, start_logging
+
+# Maximum number of notifications waiting for delivery before new ones are dropped
+MAX_PENDING_NOTIFICATIONS = 1024
+
+# Seconds to keep delivering queued notifications when the interpreter exits
+SHUTDOWN_TIMEOUT = 10
+
+# Sentinel telling the delivery worker to exit
+_STOP = object()
+
+# Seconds the delivery worker waits for more notifications to send together
+NOTIFICATION_BATCH_WINDOW = 0.25
+
+# Maximum number of notifications sent together
+MAX_NOTIFICATION_BATCH = 10
+
+# Number of rendered plots kept for reuse by later notifications
+PLOT_CACHE_SIZE = 16
+
+# Seconds before cached system information is collected again
+SYSTEM_INFO_TTL = 30
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_system_info(_period: int) -> str:
+    """Format system information once per cache period."""
+    return SystemInfo.format_system_info()
+
+
+def _system_info() -> str:
+    """Get formatted system information, refreshed every SYSTEM_INFO_TTL seconds."""
+    return _cached_system_info(int(time.monotonic() // SYSTEM_INFO_TTL))
 
 
 class TrainingNotifier:
@@ -21,6 +60,29 @@ class TrainingNotifier:
     during model training.
     """
     
+    __slots__ = (
+        "training_name",
+        "notify_every_n_epochs",
+        "notify_on_improvement",
+        "notify_on_error",
+        "include_plots",
+        "include_system_info",
+        "metric_buffer_size",
+        "config",
+        "metric_tracker",
+        "notifiers",
+        "training_config",
+        "_epoch_buf",
+        "_last_epoch",
+        "_pending_steps",
+        "_queue",
+        "_worker",
+        "_pool",
+        "_plot_cache",
+        "_exit_hook",
+        "__weakref__",
+    )
+    
     def __init__(
         self,
         training_name: str = "ML Training",
@@ -36,6 +98,9 @@ class TrainingNotifier:
         slack_webhook_url: Optional[str] = None,
         discord_webhook_url: Optional[str] = None,
         config: Optional[Dict[str, Any]] = None,
+        history_path: Optional[str] = None,
+        metric_buffer_size: int = 1,
+        initial_capacity: int = INITIAL_CAPACITY,
     ):
         """
         Initialize TrainingNotifier.
@@ -54,13 +119,23 @@ class TrainingNotifier:
             slack_webhook_url: Slack webhook URL for notifications
             discord_webhook_url: Discord webhook URL for notifications
             config: Additional configuration dictionary
+            history_path: Optional file to stream logged metric values to;
+                an existing file is overwritten. Closed by training_complete.
+            metric_buffer_size: For metrics logged without an epoch, run the
+                improvement checks only every N logging calls
+            initial_capacity: Values preallocated per metric; set to the
+                expected number of epochs (or steps) to avoid regrowing
+                storage. run() sizes it from its epoch count.
         """
+        start_logging()
+        
         self.training_name = training_name
         self.notify_every_n_epochs = notify_every_n_epochs
         self.notify_on_improvement = notify_on_improvement
         self.notify_on_error = notify_on_error
         self.include_plots = include_plots
         self.include_system_info = include_system_info
+        self.metric_buffer_size = max(1, metric_buffer_size)
         
         # Initialize config
         self.config = Config(config or {})
@@ -84,31 +159,61 @@ class TrainingNotifier:
             self.config.set('discord_webhook_url', discord_webhook_url)
         
         # Initialize components
-        self.metric_tracker = MetricTracker()
+        self.metric_tracker = MetricTracker(
+            history_path=history_path, initial_capacity=initial_capacity
+        )
         self.notifiers = self._setup_notifiers()
         self.training_config = {}
         
-        print(f"TrainAlert initialized for '{training_name}'")
-        print(f"Active notifiers: {[n.__class__.__name__ for n in self.notifiers if n.is_enabled()]}")
+        # Rendered PNGs keyed by the data they show, oldest first
+        self._plot_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        
+        # Metrics logged for the current epoch, checked once the epoch ends
+        self._epoch_buf: Dict[str, float] = {}
+        self._last_epoch: Optional[int] = None
+        self._pending_steps = 0
+        
+        # Notifications are delivered by a background worker so the training
+        # loop never waits on network round trips
+        self._queue: queue.Queue = queue.Queue(maxsize=MAX_PENDING_NOTIFICATIONS)
+        self._worker: Optional[threading.Thread] = None
+        # Sends to multiple channels in parallel; created on first fan-out
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Delivers what is still queued when the interpreter exits
+        self._exit_hook: Optional[Callable[[], None]] = None
+        
+        logger.info("TrainAlert initialized for '%s'", training_name)
+        logger.info("Active notifiers: %s", [n.__class__.__name__ for n in self.notifiers])
     
     def _setup_notifiers(self) -> List:
-        """Setup notification backends."""
+        """
+        Setup notification backends that have the settings they need.
+        
+        Only configured backends are created, so every returned notifier
+        starts out enabled.
+        """
         notifiers = []
         
+        # Notifiers read their settings once, from a frozen snapshot
+        config = self.config.freeze()
+        
+        # Backends are imported only when configured, so unused ones never
+        # load smtplib/requests
+        
         # Email notifier
-        email_notifier = EmailNotifier(self.config.config)
-        if email_notifier.is_enabled():
-            notifiers.append(email_notifier)
+        if config.get('email_address') and config.get('email_password'):
+            from .notifiers.email import EmailNotifier
+            notifiers.append(EmailNotifier(config))
         
         # Slack notifier
-        slack_notifier = SlackNotifier(self.config.config)
-        if slack_notifier.is_enabled():
-            notifiers.append(slack_notifier)
+        if config.get('slack_webhook_url'):
+            from .notifiers.slack import SlackNotifier
+            notifiers.append(SlackNotifier(config))
         
         # Discord notifier
-        discord_notifier = DiscordNotifier(self.config.config)
-        if discord_notifier.is_enabled():
-            notifiers.append(discord_notifier)
+        if config.get('discord_webhook_url'):
+            from .notifiers.discord import DiscordNotifier
+            notifiers.append(DiscordNotifier(config))
         
         return notifiers
     
@@ -120,17 +225,23 @@ class TrainingNotifier:
             config: Training configuration dictionary
         """
         self.training_config = config or {}
-        message = MessageFormatter.format_training_start(self.training_name, self.training_config)
+        if not self._has_active_notifiers():
+            return
+        
+        body = MessageFormatter.format_training_start(self.training_name, self.training_config)
         
+        # The HTML email shows system info in its own block, so it is only
+        # appended to the plain-text message
         system_info = None
+        message = body
         if self.include_system_info:
-            system_info = SystemInfo.format_system_info()
-            message += f"\n\n{system_info}"
+            system_info = _system_info()
+            message = "\n\n".join((body, system_info))
         
         html = MessageFormatter.create_html_email(
             "Training Started",
-            message,
-            system_info=system_info if self.include_system_info else None
+            body,
+            system_info=system_info
         )
         
         self._send_to_all_notifiers("🚀 Training Started", message, html=html)
@@ -139,46 +250,129 @@ class TrainingNotifier:
         """
         Log a metric value.
         
+        Improvement and periodic notifications are evaluated once per epoch,
+        when a metric for a new epoch is logged (or on checkpoint/completion).
+        
         Args:
             metric_name: Name of the metric (e.g., 'loss', 'accuracy')
-            value: Metric value
+            value: Metric value; must be a number (anything float() accepts)
             epoch: Optional epoch number
+        
+        Raises:
+            TypeError: If value is not a number
         """
-        self.metric_tracker.log(metric_name, value, epoch)
+        if epoch != self._last_epoch:
+            self.flush_metrics()
         
-        # Check for improvement notification
-        if self.notify_on_improvement and self.metric_tracker.check_improvement(metric_name):
-            best_info = self.metric_tracker.get_best(metric_name)
-            if best_info and len(self.metric_tracker.get_all(metric_name)) > 1:
-                # Get previous value
-                all_values = self.metric_tracker.get_all(metric_name)
-                if len(all_values) >= 2:
-                    prev_value = all_values[-2]
-                    message = MessageFormatter.format_improvement(
-                        metric_name, prev_value, value, epoch or len(all_values)
-                    )
-                    self._send_to_all_notifiers(
-                        f"📈 {metric_name.title()} Improved!",
-                        message
-                    )
+        self.metric_tracker.log(metric_name, value, epoch)
+        self._epoch_buf[metric_name] = float(value)
+        self._last_epoch = epoch
         
-        # Check for epoch-based notification
-        if epoch and self.notify_every_n_epochs > 0:
-            if epoch % self.notify_every_n_epochs == 0:
-                self.checkpoint(f"Epoch {epoch} completed")
+        # Without an epoch there is no boundary to wait for
+        if epoch is None:
+            self._end_step()
     
-    def log_metrics(self, metrics: Dict[str, float], epoch: Optional[int] = None):
+    def log_metrics(self, metrics: Mapping[str, float], epoch: Optional[int] = None):
         """
         Log multiple metrics at once.
         
+        Only the every-N-epochs checkpoint is sent from here; improvement
+        notifications are left to log_metric. Any mapping works, e.g. the
+        `logs` dict passed to Keras callbacks.
+        
         Args:
-            metrics: Dictionary of metric names to values
+            metrics: Mapping of metric names to numeric values
             epoch: Optional epoch number
+        
+        Raises:
+            TypeError: If a value is not a number
         """
+        # Finish any epoch still buffered by log_metric first
+        self.flush_metrics()
+        
         for metric_name, value in metrics.items():
             self.metric_tracker.log(metric_name, value, epoch)
         
         # Epoch-based notification
+        if epoch and self.notify_every_n_epochs > 0:
+            if epoch % self.notify_every_n_epochs == 0:
+                self.checkpoint(f"Epoch {epoch} completed", dict(metrics))
+    
+    def run(
+        self,
+        epochs: int,
+        step: Callable[[int], Dict[str, float]]
+    ) -> Dict[str, float]:
+        """
+        Run a training loop, logging the metrics of each epoch.
+        
+        Calls `step(epoch)` for epochs 1..`epochs` and logs the returned
+        metrics. If `step` raises, an error notification is sent and the
+        exception is re-raised.
+        
+        Args:
+            epochs: Number of epochs to run
+            step: Function training one epoch and returning its metrics
+        
+        Returns:
+            Metrics returned by the last epoch
+        """
+        self.metric_tracker.reserve(epochs)
+        
+        metrics: Dict[str, float] = {}
+        try:
+            for epoch in range(1, epochs + 1):
+                metrics = step(epoch)
+                self.log_metrics(metrics, epoch=epoch)
+        except Exception as e:
+            self.on_error(e)
+            raise
+        return metrics
+    
+    def _end_step(self):
+        """Count a logged step without an epoch, flushing every metric_buffer_size steps."""
+        self._pending_steps += 1
+        if self._pending_steps >= self.metric_buffer_size:
+            self.flush_metrics()
+    
+    def flush_metrics(self):
+        """
+        Run improvement and epoch-based notifications for buffered metrics.
+        
+        Called automatically at epoch boundaries, every `metric_buffer_size`
+        steps logged without an epoch, and before checkpoints and completion.
+        """
+        self._pending_steps = 0
+        if not self._epoch_buf:
+            return
+        
+        metrics = self._epoch_buf
+        epoch = self._last_epoch
+        self._epoch_buf = {}
+        
+        # Check for improvement notification
+        if self.notify_on_improvement and self._has_active_notifiers():
+            improved = []
+            messages = []
+            for metric_name, value in metrics.items():
+                if not self.metric_tracker.check_improvement(metric_name):
+                    continue
+                all_values = self.metric_tracker.get_array(metric_name)
+                if len(all_values) >= 2:
+                    improved.append(metric_name)
+                    messages.append(MessageFormatter.format_improvement(
+                        metric_name, float(all_values[-2]), value, epoch or len(all_values),
+                        is_loss=self.metric_tracker.is_loss(metric_name)
+                    ))
+            
+            if improved:
+                if len(improved) == 1:
+                    subject = f"📈 {improved[0].title()} Improved!"
+                else:
+                    subject = f"📈 {len(improved)} Metrics Improved!"
+                self._send_to_all_notifiers(subject, "\n\n".join(messages))
+        
+        # Check for epoch-based notification
         if epoch and self.notify_every_n_epochs > 0:
             if epoch % self.notify_every_n_epochs == 0:
                 self.checkpoint(f"Epoch {epoch} completed", metrics)
@@ -191,6 +385,10 @@ class TrainingNotifier:
             message: Checkpoint message
             metrics: Optional current metrics dictionary
         """
+        self.flush_metrics()
+        if not self._has_active_notifiers():
+            return
+        
         # Get latest metrics if not provided
         if metrics is None:
             metrics = {}
@@ -209,7 +407,8 @@ class TrainingNotifier:
         html = MessageFormatter.create_html_email(
             "Checkpoint",
             formatted_message,
-            has_plots=bool(attachments)
+            has_plots=bool(attachments),
+            plot_count=len(attachments) if attachments else 0
         )
         
         self._send_to_all_notifiers(
@@ -226,17 +425,25 @@ class TrainingNotifier:
         Args:
             final_metrics: Optional final metrics dictionary
         """
+        self.flush_metrics()
+        self.metric_tracker.close()
+        if not self._has_active_notifiers():
+            self._stop_worker()
+            return
+        
         summary = self.metric_tracker.get_summary()
-        message = MessageFormatter.format_training_complete(
+        body = MessageFormatter.format_training_complete(
             self.training_name,
             summary,
             final_metrics
         )
         
-        # Add system info
+        # Add system info (to the plain-text message only, see start_training)
+        system_info = None
+        message = body
         if self.include_system_info:
-            system_info = SystemInfo.format_system_info()
-            message += f"\n\n{system_info}"
+            system_info = _system_info()
+            message = "\n\n".join((body, system_info))
         
         # Generate plots
         attachments = None
@@ -245,9 +452,10 @@ class TrainingNotifier:
         
         html = MessageFormatter.create_html_email(
             "Training Complete",
-            message,
-            system_info=SystemInfo.format_system_info() if self.include_system_info else None,
-            has_plots=bool(attachments)
+            body,
+            system_info=system_info,
+            has_plots=bool(attachments),
+            plot_count=len(attachments) if attachments else 0
         )
         
         self._send_to_all_notifiers(
@@ -256,6 +464,9 @@ class TrainingNotifier:
             attachments=attachments,
             html=html
         )
+        
+        # Deliver everything still queued before returning
+        self._stop_worker()
     
     def on_error(self, error: Union[str, Exception]):
         """
@@ -264,7 +475,7 @@ class TrainingNotifier:
         Args:
             error: Error message or exception
         """
-        if not self.notify_on_error:
+        if not self.notify_on_error or not self._has_active_notifiers():
             return
         
         error_message = str(error)
@@ -287,51 +498,222 @@ class TrainingNotifier:
             message,
             html=html
         )
+        
+        # The process is likely about to exit, so don't leave the alert queued
+        self.flush()
     
-    def _generate_plots(self) -> List:
-        """Generate plots for all metrics."""
+    def _generate_plots(self) -> List[bytes]:
+        """Generate PNG plots for all metrics, reusing renders of unchanged data."""
+        # matplotlib-backed; imported only when plots are actually needed
+        from .visualizers.plots import PlotGenerator
+        
         attachments = []
+        metrics = self.metric_tracker.metrics
+        epochs = self.metric_tracker.epochs if self.metric_tracker.epochs else None
         
         # Generate individual plots or multi-metric plot
-        if len(self.metric_tracker.metrics) <= 4:
+        if len(metrics) <= 4:
             # Create multi-metric plot
-            plot = PlotGenerator.create_multi_metric_plot(
-                self.metric_tracker.metrics,
-                self.metric_tracker.epochs if self.metric_tracker.epochs else None
+            key = tuple(self._plot_key(name, values, epochs) for name, values in metrics.items())
+            plot = self._cached_plot(
+                key, lambda: PlotGenerator.create_multi_metric_plot(metrics, epochs)
             )
             if plot:
                 attachments.append(plot)
         else:
             # Create individual plots for each metric
-            for metric_name, values in self.metric_tracker.metrics.items():
-                plot = PlotGenerator.create_metric_plot(
-                    metric_name,
-                    values,
-                    self.metric_tracker.epochs if self.metric_tracker.epochs else None
+            for metric_name, values in metrics.items():
+                best = self.metric_tracker.get_best(metric_name)
+                plot = self._cached_plot(
+                    self._plot_key(metric_name, values, epochs),
+                    lambda: PlotGenerator.create_metric_plot(
+                        metric_name, values, epochs,
+                        best_idx=best['index'] if best else None
+                    )
                 )
                 attachments.append(plot)
         
         return attachments
     
+    @staticmethod
+    def _plot_key(metric_name: str, values, epochs: Optional[List[int]]) -> tuple:
+        """Identify a metric's plotted data by its length and last point."""
+        return (
+            metric_name,
+            len(values),
+            float(values[-1]) if len(values) else None,
+            epochs[-1] if epochs else None
+        )
+    
+    def _cached_plot(
+        self,
+        key: tuple,
+        render: Callable[[], Optional[io.BytesIO]]
+    ) -> Optional[bytes]:
+        """
+        Get a plot from the render cache, rendering it on a miss.
+        
+        Args:
+            key: Key identifying the plotted data
+            render: Function producing the plot
+        
+        Returns:
+            PNG data, or None if nothing was plotted
+        """
+        data = self._plot_cache.get(key)
+        if data is None:
+            plot = render()
+            if plot is None:
+                return None
+            data = plot.getvalue()
+            self._plot_cache[key] = data
+            if len(self._plot_cache) > PLOT_CACHE_SIZE:
+                self._plot_cache.popitem(last=False)
+        else:
+            self._plot_cache.move_to_end(key)
+        return data
+    
+    def _has_active_notifiers(self) -> bool:
+        """Check whether any notifier would receive a notification."""
+        return any(notifier.is_enabled() for notifier in self.notifiers)
+    
+    def flush(self):
+        """Block until all queued notifications have been delivered."""
+        if self._worker is not None:
+            self._queue.join()
+    
+    def _start_worker(self):
+        """Start the background delivery worker if it is not running."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._drain,
+                name="trainalert-notifier",
+                daemon=True
+            )
+            self._worker.start()
+        
+        # The worker is a daemon thread, so without this a script that ends
+        # right after queueing a notification would exit before sending it.
+        # The hook only holds a weak reference so it doesn't keep us alive.
+        if self._exit_hook is None:
+            ref = weakref.ref(self)
+            
+            def exit_hook():
+                notifier = ref()
+                if notifier is not None:
+                    notifier._stop_worker(timeout=SHUTDOWN_TIMEOUT)
+            
+            self._exit_hook = exit_hook
+            atexit.register(exit_hook)
+    
+    def _stop_worker(self, timeout: Optional[float] = None):
+        """
+        Deliver pending notifications and stop the background worker.
+        
+        Args:
+            timeout: Maximum seconds to wait for delivery; None waits until done
+        """
+        if self._exit_hook is not None:
+            atexit.unregister(self._exit_hook)
+            self._exit_hook = None
+        
+        if self._worker is None:
+            return
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+        finished = not self._worker.is_alive()
+        self._worker = None
+        
+        if self._pool is not None:
+            self._pool.shutdown(wait=finished)
+            self._pool = None
+    
+    def _drain(self):
+        """Worker loop delivering queued notifications until stopped."""
+        while True:
+            batch = [self._queue.get()]
+            
+            # Notifications queued close together (e.g. an improvement and a
+            # checkpoint) are delivered together
+            deadline = time.monotonic() + NOTIFICATION_BATCH_WINDOW
+            while batch[-1] is not _STOP and len(batch) < MAX_NOTIFICATION_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                notifications = [item for item in batch if item is not _STOP]
+                if notifications:
+                    self._deliver(notifications)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if batch[-1] is _STOP:
+                return
+    
     def _send_to_all_notifiers(
         self,
         subject: str,
         message: str,
-        attachments: Optional[List] = None,
+        attachments: Optional[List[bytes]] = None,
         html: Optional[str] = None
     ):
-        """Send notification to all enabled notifiers."""
-        for notifier in self.notifiers:
-            if notifier.is_enabled():
-                try:
-                    notifier.send_message(
-                        subject=subject,
-                        message=message,
-                        attachments=attachments,
-                        html=html
-                    )
-                except Exception as e:
-                    print(f"Error sending notification via {notifier.__class__.__name__}: {e}")
+        """Queue notification for delivery to all enabled notifiers."""
+        self._start_worker()
+        try:
+            self._queue.put_nowait(Notification(subject, message, attachments, html))
+        except queue.Full:
+            logger.error("Notification queue full, dropping notification: %s", subject)
+    
+    def _deliver(self, notifications: List[Notification]):
+        """Send notifications to all enabled notifiers."""
+        active = [n for n in self.notifiers if n.is_enabled()]
+        if len(active) <= 1:
+            for notifier in active:
+                self._send_one(notifier, notifications)
+            return
+        
+        # Send to every channel concurrently so their round trips overlap.
+        # Attachments are immutable bytes, so sharing them is safe.
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=len(active),
+                thread_name_prefix="trainalert"
+            )
+        futures = []
+        for idx, notifier in enumerate(active):
+            try:
+                futures.append(self._pool.submit(self._send_one, notifier, notifications))
+            except RuntimeError:
+                # The executor refuses new work once interpreter shutdown has
+                # begun, which is when the exit hook drains the queue
+                for remaining in active[idx:]:
+                    self._send_one(remaining, notifications)
+                break
+        for future in as_completed(futures):
+            future.result()
+    
+    @staticmethod
+    def _send_one(notifier: BaseNotifier, notifications: List[Notification]):
+        """Send notifications via a single notifier, reporting failures."""
+        try:
+            if len(notifications) == 1:
+                notification = notifications[0]
+                notifier.send_message(
+                    subject=notification.subject,
+                    message=notification.message,
+                    attachments=notification.attachments,
+                    html=notification.html
+                )
+            else:
+                notifier.send_batch(notifications)
+        except Exception as e:
+            logger.error("Error sending notification via %s: %s", notifier.__class__.__name__, e)
     
     def get_summary(self) -> Dict[str, Any]:
         """Get training summary."""
@@ -1,7 +1,19 @@
 """Notification backend modules."""
 from .base import BaseNotifier
-from .email import EmailNotifier
-from .slack import SlackNotifier
-from .discord import DiscordNotifier
 
-__all__ = ["BaseNotifier", "EmailNotifier", "SlackNotifier", "DiscordNotifier"]
\ No newline at end of file
+__all__ = ["BaseNotifier", "EmailNotifier", "SlackNotifier", "DiscordNotifier"]
+
+# Backends are imported on first access so unused ones cost nothing
+_LAZY_NOTIFIERS = {
+    "EmailNotifier": ".email",
+    "SlackNotifier": ".slack",
+    "DiscordNotifier": ".discord",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_NOTIFIERS:
+        import importlib
+        module = importlib.import_module(_LAZY_NOTIFIERS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
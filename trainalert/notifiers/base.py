@@ -1,13 +1,117 @@
 """Base notifier class."""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+import functools
+from typing import Any, Mapping, NamedTuple, Optional, List, Union, TYPE_CHECKING
 import io
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import requests
+
+# Timeout (seconds) applied to every webhook request
+REQUEST_TIMEOUT = 10
+
+# Responses that are retried with backoff (rate limited or gateway errors)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+_session: Optional["requests.Session"] = None
+
+
+def get_session() -> "requests.Session":
+    """
+    Get the HTTP session shared by all webhook notifiers.
+    
+    The session keeps connections alive between notifications so repeated
+    posts to the same webhook host skip the TCP/TLS handshake, and retries
+    rate-limited or transiently failing posts with backoff.
+    
+    Returns:
+        Shared requests session
+    """
+    global _session
+    if _session is None:
+        # Imported here so `import trainalert` doesn't pay for requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=RETRY_STATUSES,
+                # Webhook notifications are POSTs, which urllib3 doesn't
+                # retry on status by default
+                allowed_methods=frozenset({"POST"}),
+                # A read error means the server may already have accepted
+                # the message; retrying it could post a duplicate
+                read=0,
+                raise_on_status=False
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+    
+    Uses orjson when installed (including NumPy scalars and arrays),
+    falling back to the standard library.
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode('utf-8')
+
+
+class Notification(NamedTuple):
+    """A single notification, as queued for delivery."""
+    
+    subject: str
+    message: str
+    attachments: Optional[List[bytes]] = None
+    html: Optional[str] = None
+
+
+def attachment_bytes(attachment: Union[bytes, io.BytesIO]) -> bytes:
+    """
+    Get the raw data of an attachment.
+    
+    Attachments are PNG bytes; BytesIO buffers are still accepted.
+    
+    Args:
+        attachment: Attachment data or buffer
+    
+    Returns:
+        Attachment bytes
+    """
+    if isinstance(attachment, io.BytesIO):
+        return attachment.getvalue()
+    return attachment
+
 
 class BaseNotifier(ABC):
     """Abstract base class for all notifiers."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         """
         Initialize the notifier.
         
@@ -22,7 +126,7 @@ class BaseNotifier(ABC):
         self,
         subject: str,
         message: str,
-        attachments: Optional[List[io.BytesIO]] = None,
+        attachments: Optional[List[bytes]] = None,
         **kwargs
     ) -> bool:
         """
@@ -31,7 +135,7 @@ class BaseNotifier(ABC):
         Args:
             subject: Message subject
             message: Message body
-            attachments: Optional list of attachments
+            attachments: Optional list of attachments (PNG bytes)
             **kwargs: Additional parameters
         
         Returns:
@@ -39,6 +143,60 @@ class BaseNotifier(ABC):
         """
         pass
     
+    def send_batch(self, notifications: List[Notification]) -> bool:
+        """
+        Send several notifications.
+        
+        Sends them one at a time by default; webhook notifiers override this
+        to combine them into a single request.
+        
+        Args:
+            notifications: Notifications to send, oldest first
+        
+        Returns:
+            True if all were sent successfully, False otherwise
+        """
+        results = [
+            self.send_message(
+                subject=n.subject,
+                message=n.message,
+                attachments=n.attachments,
+                html=n.html
+            )
+            for n in notifications
+        ]
+        return all(results)
+    
+    async def send_message_async(
+        self,
+        subject: str,
+        message: str,
+        attachments: Optional[List[bytes]] = None,
+        **kwargs
+    ) -> bool:
+        """
+        Send a notification message from async code.
+        
+        Runs send_message in the event loop's default executor so the
+        loop is not blocked for the network round trip.
+        
+        Args:
+            subject: Message subject
+            message: Message body
+            attachments: Optional list of attachments (PNG bytes)
+            **kwargs: Additional parameters
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.send_message, subject, message, attachments, **kwargs)
+        )
+    
     def disable(self):
         """Disable this notifier."""
         self.enabled = False
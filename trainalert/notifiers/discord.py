@@ -1,14 +1,87 @@
 """Discord notifier implementation."""
-import requests
-import io
-from typing import Dict, Any, Optional, List
-from .base import BaseNotifier
+from typing import Any, Mapping, Optional, List
+from .base import (
+    BaseNotifier, Notification, attachment_bytes, get_session, dumps_json, REQUEST_TIMEOUT
+)
+from .._logging import logger
+
+# Discord accepts at most 10 embeds, 10 files and 6000 characters of embed
+# text per message; a message over any limit is rejected as a whole
+MAX_BATCH_SIZE = 10
+MAX_FILES = 10
+MAX_EMBED_CHARS = 6000
+
+# Discord limits are counted in characters, not bytes; leave room for the
+# code block and truncation marker
+MAX_MESSAGE_LENGTH = 1900
+
+# Fields shared by every embed
+_EMBED_TEMPLATE = {
+    "color": 3447003  # Blue color
+}
+
+
+def _embed(subject: str, message: str) -> dict:
+    """Build the embed for one notification."""
+    embed = _EMBED_TEMPLATE.copy()
+    embed["title"] = subject
+    # Truncate message if too long, building the description in one step
+    if len(message) > MAX_MESSAGE_LENGTH:
+        embed["description"] = f"```\n{message[:MAX_MESSAGE_LENGTH]}\n... (truncated)\n```"
+    else:
+        embed["description"] = f"```\n{message}\n```"
+    return embed
+
+
+def _embed_length(notification: Notification) -> int:
+    """Characters a notification's embed counts towards MAX_EMBED_CHARS."""
+    embed = _embed(notification.subject, notification.message)
+    return len(embed["title"]) + len(embed["description"])
+
+
+def _split_batch(notifications: List[Notification]) -> List[List[Notification]]:
+    """
+    Group notifications into messages that stay within Discord's limits.
+    
+    Args:
+        notifications: Notifications to send, oldest first
+    
+    Returns:
+        Consecutive groups of notifications, one per message
+    """
+    chunks = []
+    chunk: List[Notification] = []
+    files = chars = 0
+    for notification in notifications:
+        n_files = len(notification.attachments or ())
+        n_chars = _embed_length(notification)
+        if chunk and (
+            len(chunk) == MAX_BATCH_SIZE
+            or files + n_files > MAX_FILES
+            or chars + n_chars > MAX_EMBED_CHARS
+        ):
+            chunks.append(chunk)
+            chunk = []
+            files = chars = 0
+        chunk.append(notification)
+        files += n_files
+        chars += n_chars
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _build_payload(notifications: List[Notification]) -> bytes:
+    """Encode notifications as one Discord message with an embed each."""
+    return dumps_json({
+        "embeds": [_embed(n.subject, n.message) for n in notifications]
+    })
 
 
 class DiscordNotifier(BaseNotifier):
     """Send notifications via Discord webhook."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         """
         Initialize Discord notifier.
         
@@ -20,14 +93,14 @@ class DiscordNotifier(BaseNotifier):
         self.webhook_url = config.get('discord_webhook_url')
         
         if not self.webhook_url:
-            print("Warning: Discord webhook URL not provided. Discord notifications disabled.")
+            logger.warning("Warning: Discord webhook URL not provided. Discord notifications disabled.")
             self.enabled = False
     
     def send_message(
         self,
         subject: str,
         message: str,
-        attachments: Optional[List[io.BytesIO]] = None,
+        attachments: Optional[List[bytes]] = None,
         **kwargs
     ) -> bool:
         """
@@ -45,54 +118,98 @@ class DiscordNotifier(BaseNotifier):
         if not self.enabled:
             return False
         
+        return self._post([Notification(subject, message, attachments)], subject)
+    
+    def send_batch(self, notifications: List[Notification]) -> bool:
+        """
+        Send several notifications, combining them into as few Discord
+        messages as its per-message limits allow.
+        
+        Args:
+            notifications: Notifications to send, oldest first
+        
+        Returns:
+            True if all messages sent successfully, False otherwise
+        """
+        if not self.enabled:
+            return False
+        
+        results = [
+            self._post(chunk, ", ".join(n.subject for n in chunk))
+            for chunk in _split_batch(notifications)
+        ]
+        return all(results)
+    
+    def _post(self, notifications: List[Notification], description: str) -> bool:
+        """
+        Post notifications to the webhook as one message.
+        
+        Files beyond MAX_FILES (a single notification can carry one plot per
+        metric) follow in additional file-only messages.
+        
+        Args:
+            notifications: Notifications within Discord's message limits
+            description: What is being sent, for status output
+        
+        Returns:
+            True if message sent successfully, False otherwise
+        """
         try:
-            # Truncate message if too long for Discord (2000 char limit in description)
-            max_length = 1900  # Leave room for code blocks
-            if len(message) > max_length:
-                message = message[:max_length] + "\n... (truncated)"
-            
             # Format message for Discord
-            discord_message = {
-                "embeds": [
-                    {
-                        "title": subject,
-                        "description": f"```\n{message}\n```",
-                        "color": 3447003  # Blue color
-                    }
-                ]
-            }
+            payload = _build_payload(notifications)
+            attachments = [
+                attachment_bytes(attachment)
+                for notification in notifications
+                for attachment in notification.attachments or []
+            ]
             
-            # Prepare files if attachments provided
-            files = {}
-            if attachments:
-                for idx, attachment in enumerate(attachments):
-                    files[f'file{idx}'] = (f'plot_{idx+1}.png', attachment.read(), 'image/png')
-                    attachment.seek(0)  # Reset buffer
-            
-            # Send message with proper multipart/form-data encoding
-            if files:
-                import json
-                # Use multipart/form-data for file uploads
-                response = requests.post(
-                    self.webhook_url,
-                    data={'payload_json': json.dumps(discord_message)},
-                    files=files
-                )
-            else:
-                # Use JSON for text-only messages
-                response = requests.post(
-                    self.webhook_url,
-                    json=discord_message,
-                    headers={'Content-Type': 'application/json'}
-                )
+            response = self._request(payload, attachments[:MAX_FILES], 0)
+            for start in range(MAX_FILES, len(attachments), MAX_FILES):
+                if response.status_code not in [200, 204]:
+                    break
+                response = self._request(None, attachments[start:start + MAX_FILES], start)
             
             if response.status_code in [200, 204]:
-                print(f"✓ Discord message sent: {subject}")
+                logger.info("✓ Discord message sent: %s", description)
                 return True
             else:
-                print(f"✗ Failed to send Discord message: {response.status_code} - {response.text}")
+                logger.error("✗ Failed to send Discord message: %s - %s", response.status_code, response.text)
                 return False
                 
         except Exception as e:
-            print(f"✗ Failed to send Discord message: {e}")
-            return False
\ No newline at end of file
+            logger.error("✗ Failed to send Discord message: %s", e)
+            return False
+    
+    def _request(self, payload: Optional[bytes], attachments: List[bytes], first_index: int):
+        """
+        Make one webhook request.
+        
+        Args:
+            payload: Encoded embeds, or None for a file-only message
+            attachments: PNG data to upload, at most MAX_FILES
+            first_index: Number of files already sent, for file naming
+        
+        Returns:
+            HTTP response
+        """
+        # Send message with proper multipart/form-data encoding
+        if attachments:
+            # Use multipart/form-data for file uploads
+            files = {
+                f'file{idx}': (f'plot_{first_index+idx+1}.png', attachment, 'image/png')
+                for idx, attachment in enumerate(attachments)
+            }
+            return get_session().post(
+                self.webhook_url,
+                data={'payload_json': payload.decode('utf-8')} if payload else None,
+                files=files,
+                timeout=REQUEST_TIMEOUT
+            )
+        
+        # Use JSON for text-only messages
+        return get_session().post(
+            self.webhook_url,
+            data=payload,
+            headers={'Content-Type': 'application/json'},
+            timeout=REQUEST_TIMEOUT
+        )
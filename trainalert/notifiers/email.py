@@ -1,17 +1,18 @@
 """Email notifier implementation."""
-import smtplib
-import io
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
-from typing import Dict, Any, Optional, List
-from .base import BaseNotifier
+import atexit
+import threading
+from typing import Any, Mapping, Optional, List, TYPE_CHECKING
+from .base import BaseNotifier, attachment_bytes
+from .._logging import logger
+
+if TYPE_CHECKING:
+    import smtplib
 
 
 class EmailNotifier(BaseNotifier):
     """Send notifications via email."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         """
         Initialize email notifier.
         
@@ -25,16 +26,64 @@ class EmailNotifier(BaseNotifier):
         self.smtp_server = config.get('smtp_server', 'smtp.gmail.com')
         self.smtp_port = config.get('smtp_port', 587)
         self.recipient_email = config.get('recipient_email', self.email_address)
+        self._smtp: Optional["smtplib.SMTP"] = None
+        # Serializes use of the shared SMTP connection across sender threads
+        self._smtp_lock = threading.Lock()
         
         if not self.email_address or not self.email_password:
-            print("Warning: Email credentials not provided. Email notifications disabled.")
+            logger.warning("Warning: Email credentials not provided. Email notifications disabled.")
             self.enabled = False
+        else:
+            atexit.register(self.close)
+    
+    def _get_smtp(self) -> "smtplib.SMTP":
+        """
+        Get a logged-in SMTP connection, reusing the previous one if still alive.
+        
+        Returns:
+            Connected and authenticated SMTP client
+        """
+        import smtplib
+        
+        if self._smtp is not None:
+            try:
+                status, _ = self._smtp.noop()
+                if status == 250:
+                    return self._smtp
+            except smtplib.SMTPException:
+                pass
+            self._close_smtp()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.email_address, self.email_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+    
+    def _close_smtp(self):
+        """Close the cached SMTP connection, ignoring errors."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            self._smtp.close()
+        self._smtp = None
+    
+    def close(self):
+        """Close the cached SMTP connection."""
+        with self._smtp_lock:
+            self._close_smtp()
     
     def send_message(
         self,
         subject: str,
         message: str,
-        attachments: Optional[List[io.BytesIO]] = None,
+        attachments: Optional[List[bytes]] = None,
         html: Optional[str] = None,
         **kwargs
     ) -> bool:
@@ -54,37 +103,46 @@ class EmailNotifier(BaseNotifier):
         if not self.enabled:
             return False
         
+        # Imported on first send; unused when email is not configured
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.image import MIMEImage
+        
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.email_address
-            msg['To'] = self.recipient_email
-            msg['Subject'] = subject
-            
-            # Attach plain text
-            msg.attach(MIMEText(message, 'plain'))
-            
-            # Attach HTML if provided
+            # Text and HTML alternatives, with plots as related parts so
+            # each image is sent once and shown inline by the HTML body
+            body = MIMEMultipart('alternative')
+            body.attach(MIMEText(message, 'plain'))
             if html:
-                msg.attach(MIMEText(html, 'html'))
+                body.attach(MIMEText(html, 'html'))
             
-            # Attach images if provided
             if attachments:
+                msg = MIMEMultipart('related')
+                msg.attach(body)
                 for idx, attachment in enumerate(attachments):
-                    img = MIMEImage(attachment.read())
-                    img.add_header('Content-Disposition', f'attachment; filename=plot_{idx+1}.png')
+                    img = MIMEImage(attachment_bytes(attachment), 'png')
+                    img.add_header('Content-ID', f'<plot{idx}>')
+                    img.add_header('Content-Disposition', 'inline', filename=f'plot_{idx+1}.png')
                     msg.attach(img)
-                    attachment.seek(0)  # Reset buffer
+            else:
+                msg = body
+            
+            msg['From'] = self.email_address
+            msg['To'] = self.recipient_email
+            msg['Subject'] = subject
             
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_address, self.email_password)
-                server.send_message(msg)
+            # Send email over the cached connection, reconnecting once if it dropped
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    self._close_smtp()
+                    self._get_smtp().send_message(msg)
             
-            print(f"✓ Email sent: {subject}")
+            logger.info("✓ Email sent: %s", subject)
             return True
             
         except Exception as e:
-            print(f"✗ Failed to send email: {e}")
+            logger.error("✗ Failed to send email: %s", e)
             return False
\ No newline at end of file
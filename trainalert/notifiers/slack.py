@@ -1,14 +1,70 @@
 """Slack notifier implementation."""
-import requests
-import io
-from typing import Dict, Any, Optional, List
-from .base import BaseNotifier
+from typing import Any, Mapping, Optional, List
+from .base import BaseNotifier, Notification, get_session, dumps_json, REQUEST_TIMEOUT
+from .._logging import logger
+
+# Placeholder marking where per-message strings are spliced into the payload
+_PLACEHOLDER = "\x00"
+
+# Slack message layout, serialized once. Splitting on the encoded placeholder
+# leaves the static JSON around the header text and the section text.
+_PAYLOAD_PARTS = dumps_json({
+    "blocks": [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": _PLACEHOLDER,
+                "emoji": True
+            }
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": _PLACEHOLDER
+            }
+        }
+    ]
+}).split(dumps_json(_PLACEHOLDER))
+
+
+# Slack accepts at most 50 blocks per message; each notification uses two
+MAX_BATCH_SIZE = 25
+
+
+def _build_payload(subject: str, message: str) -> bytes:
+    """Encode a Slack message, serializing only the per-message strings."""
+    head, middle, tail = _PAYLOAD_PARTS
+    return head + dumps_json(subject) + middle + dumps_json(f"```{message}```") + tail
+
+
+def _build_batch_payload(notifications: List[Notification]) -> bytes:
+    """Encode several notifications as one Slack message."""
+    blocks = []
+    for notification in notifications:
+        blocks.append({
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": notification.subject,
+                "emoji": True
+            }
+        })
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"```{notification.message}```"
+            }
+        })
+    return dumps_json({"blocks": blocks})
 
 
 class SlackNotifier(BaseNotifier):
     """Send notifications via Slack webhook."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         """
         Initialize Slack notifier.
         
@@ -20,14 +76,14 @@ class SlackNotifier(BaseNotifier):
         self.webhook_url = config.get('slack_webhook_url')
         
         if not self.webhook_url:
-            print("Warning: Slack webhook URL not provided. Slack notifications disabled.")
+            logger.warning("Warning: Slack webhook URL not provided. Slack notifications disabled.")
             self.enabled = False
     
     def send_message(
         self,
         subject: str,
         message: str,
-        attachments: Optional[List[io.BytesIO]] = None,
+        attachments: Optional[List[bytes]] = None,
         **kwargs
     ) -> bool:
         """
@@ -45,41 +101,56 @@ class SlackNotifier(BaseNotifier):
         if not self.enabled:
             return False
         
+        return self._post(_build_payload(subject, message), subject)
+    
+    def send_batch(self, notifications: List[Notification]) -> bool:
+        """
+        Send several notifications as one Slack message per 25 notifications.
+        
+        Args:
+            notifications: Notifications to send, oldest first
+        
+        Returns:
+            True if all messages sent successfully, False otherwise
+        """
+        if not self.enabled:
+            return False
+        
+        results = []
+        for start in range(0, len(notifications), MAX_BATCH_SIZE):
+            chunk = notifications[start:start + MAX_BATCH_SIZE]
+            results.append(self._post(
+                _build_batch_payload(chunk),
+                ", ".join(n.subject for n in chunk)
+            ))
+        return all(results)
+    
+    def _post(self, payload: bytes, description: str) -> bool:
+        """
+        Post an encoded payload to the webhook.
+        
+        Args:
+            payload: JSON-encoded Slack message
+            description: What is being sent, for status output
+        
+        Returns:
+            True if message sent successfully, False otherwise
+        """
         try:
-            # Format message for Slack
-            slack_message = {
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": subject,
-                            "emoji": True
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"```{message}```"
-                        }
-                    }
-                ]
-            }
-            
-            response = requests.post(
+            response = get_session().post(
                 self.webhook_url,
-                json=slack_message,
-                headers={'Content-Type': 'application/json'}
+                data=payload,
+                headers={'Content-Type': 'application/json'},
+                timeout=REQUEST_TIMEOUT
             )
             
             if response.status_code == 200:
-                print(f"✓ Slack message sent: {subject}")
+                logger.info("✓ Slack message sent: %s", description)
                 return True
             else:
-                print(f"✗ Failed to send Slack message: {response.status_code}")
+                logger.error("✗ Failed to send Slack message: %s", response.status_code)
                 return False
                 
         except Exception as e:
-            print(f"✗ Failed to send Slack message: {e}")
-            return False
\ No newline at end of file
+            logger.error("✗ Failed to send Slack message: %s", e)
+            return False
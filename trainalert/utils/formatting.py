@@ -1,6 +1,30 @@
 """Email and message formatting utilities."""
-from typing import Dict, Any, Optional
+import html
+import io
+import numbers
 from datetime import datetime
+from typing import Dict, Any, Optional
+
+from .metrics import _is_loss_name
+
+
+def _timestamp() -> str:
+    """Current local time as YYYY-MM-DD HH:MM:SS, without strftime."""
+    now = datetime.now()
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d} "
+        f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+    )
+
+
+def _format_value(value: Any) -> str:
+    """Format a metric value, with fixed precision for floats."""
+    return f"{value:.6f}" if isinstance(value, float) else f"{value}"
+
+
+def _format_number(value: Any) -> str:
+    """Format a summary number with fixed precision, or a placeholder like 'N/A' as is."""
+    return f"{value:.6f}" if isinstance(value, numbers.Real) else f"{value}"
 
 
 class MessageFormatter:
@@ -9,37 +33,26 @@ class MessageFormatter:
     @staticmethod
     def format_training_start(training_name: str, config: Dict[str, Any]) -> str:
         """Format training start message."""
-        lines = [
-            f"🚀 Training Started: {training_name}",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-        ]
+        message = f"🚀 Training Started: {training_name}\nTime: {_timestamp()}\n"
         
         if config:
-            lines.append("Configuration:")
-            for key, value in config.items():
-                lines.append(f"  {key}: {value}")
+            message += "\nConfiguration:\n" + "\n".join(
+                f"  {key}: {value}" for key, value in config.items()
+            )
         
-        return "\n".join(lines)
+        return message
     
     @staticmethod
     def format_checkpoint(message: str, metrics: Optional[Dict[str, Any]] = None) -> str:
         """Format checkpoint message."""
-        lines = [
-            f"📍 Checkpoint: {message}",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-        ]
+        text = f"📍 Checkpoint: {message}\nTime: {_timestamp()}\n"
         
         if metrics:
-            lines.append("Current Metrics:")
-            for key, value in metrics.items():
-                if isinstance(value, float):
-                    lines.append(f"  {key}: {value:.6f}")
-                else:
-                    lines.append(f"  {key}: {value}")
+            text += "\nCurrent Metrics:\n" + "\n".join(
+                f"  {key}: {_format_value(value)}" for key, value in metrics.items()
+            )
         
-        return "\n".join(lines)
+        return text
     
     @staticmethod
     def format_training_complete(
@@ -48,70 +61,64 @@ class MessageFormatter:
         final_metrics: Optional[Dict[str, Any]] = None
     ) -> str:
         """Format training completion message."""
-        lines = [
-            f"✅ Training Complete: {training_name}",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "Summary:",
-            f"  Total Epochs: {summary.get('total_epochs', 'N/A')}",
-            f"  Training Time: {summary.get('elapsed_time_formatted', 'N/A')}",
-            "",
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        
+        write(
+            f"✅ Training Complete: {training_name}\n"
+            f"Time: {_timestamp()}\n"
+            "\n"
+            "Summary:\n"
+            f"  Total Epochs: {summary.get('total_epochs', 'N/A')}\n"
+            f"  Training Time: {summary.get('elapsed_time_formatted', 'N/A')}\n"
+        )
         
         # Add metric summary
-        if 'metrics' in summary and summary['metrics']:
-            lines.append("Metrics Summary:")
+        if summary.get('metrics'):
+            write("\nMetrics Summary:\n")
             for metric_name, metric_info in summary['metrics'].items():
-                lines.append(f"  {metric_name}:")
-                lines.append(f"    Latest: {metric_info.get('latest', 'N/A'):.6f}")
+                write(f"  {metric_name}:\n    Latest: {_format_number(metric_info.get('latest', 'N/A'))}\n")
                 if metric_info.get('best') is not None:
-                    lines.append(f"    Best: {metric_info['best']:.6f} (epoch {metric_info.get('best_epoch', 'N/A')})")
-            lines.append("")
+                    write(
+                        f"    Best: {_format_number(metric_info['best'])} "
+                        f"(epoch {metric_info.get('best_epoch', 'N/A')})\n"
+                    )
         
         # Add final metrics if provided
         if final_metrics:
-            lines.append("Final Metrics:")
-            for key, value in final_metrics.items():
-                if isinstance(value, float):
-                    lines.append(f"  {key}: {value:.6f}")
-                else:
-                    lines.append(f"  {key}: {value}")
+            write("\nFinal Metrics:\n")
+            write("\n".join(
+                f"  {key}: {_format_value(value)}" for key, value in final_metrics.items()
+            ))
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     @staticmethod
     def format_error(error_message: str, traceback: Optional[str] = None) -> str:
         """Format error message."""
-        lines = [
-            "❌ Training Error Occurred",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            f"Error: {error_message}",
-        ]
+        message = f"❌ Training Error Occurred\nTime: {_timestamp()}\n\nError: {error_message}"
         
         if traceback:
-            lines.extend([
-                "",
-                "Traceback:",
-                traceback
-            ])
+            message += f"\n\nTraceback:\n{traceback}"
         
-        return "\n".join(lines)
+        return message
     
     @staticmethod
-    def format_improvement(metric_name: str, old_value: float, new_value: float, epoch: int) -> str:
+    def format_improvement(
+        metric_name: str,
+        old_value: float,
+        new_value: float,
+        epoch: int,
+        is_loss: Optional[bool] = None
+    ) -> str:
         """Format metric improvement message."""
-        is_loss = 'loss' in metric_name.lower()
-        emoji = "📉" if is_loss else "📈"
-        
+        if is_loss is None:
+            is_loss = _is_loss_name(metric_name)
         change = new_value - old_value
-        change_str = f"{abs(change):.6f}"
-        direction = "decreased" if change < 0 else "increased"
-        
         return (
-            f"{emoji} {metric_name.title()} Improved!\n"
+            f"{'📉' if is_loss else '📈'} {metric_name.title()} Improved!\n"
             f"Epoch {epoch}: {old_value:.6f} → {new_value:.6f}\n"
-            f"({direction} by {change_str})"
+            f"({'decreased' if change < 0 else 'increased'} by {abs(change):.6f})"
         )
     
     @staticmethod
@@ -119,34 +126,73 @@ class MessageFormatter:
         subject: str,
         body: str,
         system_info: Optional[str] = None,
-        has_plots: bool = False
+        has_plots: bool = False,
+        plot_count: int = 0
     ) -> str:
-        """Create HTML formatted email."""
-        html_body = body.replace('\n', '<br>')
+        """
+        Create HTML formatted email.
+        
+        Args:
+            subject: Email heading
+            body: Plain text body
+            system_info: Optional system information block
+            has_plots: Mention that plots are attached
+            plot_count: Number of plots to show inline, referenced by
+                Content-ID as cid:plot0, cid:plot1, ...
+        """
+        # The static head is kept out of the format string so its CSS
+        # braces need no escaping; the rest is filled in one format_map call
+        fragments = [_HTML_CONTENT]
+        values = {'subject': html.escape(subject), 'body': _to_html(body)}
+        
+        if system_info:
+            fragments.append(_HTML_SYSTEM_INFO)
+            values['system_info'] = _to_html(system_info)
         
-        html = f"""
+        if plot_count:
+            fragments.append(_HTML_PLOTS)
+            values['plots'] = "".join(
+                f'<img src="cid:plot{idx}" style="max-width: 100%;"><br>'
+                for idx in range(plot_count)
+            )
+        elif has_plots:
+            fragments.append(_HTML_PLOTS_ATTACHED)
+        
+        fragments.append(_HTML_FOOTER)
+        return _HTML_HEAD + "".join(fragments).format_map(values)
+
+
+def _to_html(text: str) -> str:
+    """Escape plain text for HTML, keeping its line breaks."""
+    return html.escape(text).replace('\n', '<br>')
+
+
+# Email template fragments. _HTML_HEAD is used verbatim; the others are
+# joined and filled with str.format_map, so any literal braces in them
+# must be doubled.
+_HTML_HEAD = """
         <html>
             <head>
                 <style>
-                    body {{
+                    body {
                         font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
                         background-color: #f5f5f5;
                         padding: 20px;
-                    }}
-                    .container {{
+                    }
+                    .container {
                         background-color: white;
                         border-radius: 8px;
                         padding: 30px;
                         max-width: 800px;
                         margin: 0 auto;
                         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    }}
-                    h2 {{
+                    }
+                    h2 {
                         color: #2c3e50;
                         border-bottom: 2px solid #3498db;
                         padding-bottom: 10px;
-                    }}
-                    .content {{
+                    }
+                    .content {
                         color: #34495e;
                         line-height: 1.6;
                         font-family: 'Courier New', monospace;
@@ -154,48 +200,54 @@ class MessageFormatter:
                         padding: 15px;
                         border-radius: 5px;
                         margin: 20px 0;
-                    }}
-                    .system-info {{
+                    }
+                    .system-info {
                         background-color: #e8f4f8;
                         padding: 15px;
                         border-radius: 5px;
                         margin-top: 20px;
                         font-size: 0.9em;
-                    }}
-                    .footer {{
+                    }
+                    .footer {
                         margin-top: 30px;
                         padding-top: 20px;
                         border-top: 1px solid #ddd;
                         color: #7f8c8d;
                         font-size: 0.85em;
                         text-align: center;
-                    }}
+                    }
                 </style>
             </head>
             <body>
-                <div class="container">
+                <div class="container">"""
+
+_HTML_CONTENT = """
                     <h2>{subject}</h2>
                     <div class="content">
-                        {html_body}
+                        {body}
                     </div>
         """
-        
-        if system_info:
-            html += f"""
+
+_HTML_SYSTEM_INFO = """
                     <div class="system-info">
                         <strong>System Information:</strong><br>
-                        {system_info.replace(chr(10), '<br>')}
+                        {system_info}
                     </div>
             """
-        
-        if has_plots:
-            html += """
+
+_HTML_PLOTS = """
+                    <div style="margin-top: 20px;">
+                        {plots}
+                    </div>
+            """
+
+_HTML_PLOTS_ATTACHED = """
                     <div style="margin-top: 20px;">
                         <p><em>Training plots are attached to this email.</em></p>
                     </div>
             """
-        
-        html += """
+
+_HTML_FOOTER = """
                     <div class="footer">
                         Sent by TrainAlert - ML Training Notification System
                     </div>
@@ -203,5 +255,3 @@ class MessageFormatter:
             </body>
         </html>
         """
-        
-        return html
\ No newline at end of file
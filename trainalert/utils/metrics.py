@@ -1,74 +1,276 @@
 """Metric tracking and storage utilities."""
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
+import json
+import struct
 import time
 
+import numpy as np
+
+# Initial number of values allocated per metric
+INITIAL_CAPACITY = 64
+
+# On-disk history record: epoch (-1 if none), metric id, value
+HISTORY_RECORD = struct.Struct('<iId')
+HISTORY_DTYPE = np.dtype([('epoch', '<i4'), ('metric', '<u4'), ('value', '<f8')])
+
+
+def _is_loss_name(metric_name: str) -> bool:
+    """
+    Assume lower is better for loss/error, higher for accuracy/precision/etc.
+    
+    The single rule for a metric's direction, shared by tracking, message
+    formatting and plotting.
+    """
+    name = metric_name.lower()
+    return 'loss' in name or 'error' in name
+
 
 class MetricTracker:
-    """Tracks training metrics over time."""
+    """
+    Tracks training metrics over time.
     
-    def __init__(self):
-        self.metrics: Dict[str, List[float]] = {}
+    Values are stored per metric in float64 NumPy arrays that grow
+    geometrically, so long runs don't keep one boxed Python float per value.
+    """
+    
+    __slots__ = (
+        "_values",
+        "_sizes",
+        "epochs",
+        "_timestamps",
+        "_num_logged",
+        "start_time",
+        "_start_ns",
+        "best_metrics",
+        "history_path",
+        "_history",
+        "_metric_ids",
+        "initial_capacity",
+        "_is_loss",
+        "_epoch_set",
+    )
+    
+    def __init__(
+        self,
+        history_path: Optional[str] = None,
+        initial_capacity: int = INITIAL_CAPACITY
+    ):
+        """
+        Initialize the tracker.
+        
+        Args:
+            history_path: Optional file to append every logged value to as
+                fixed-size binary records (see read_history). Metric names
+                are written to a `<history_path>.json` sidecar. The file is
+                opened with mode 'wb', so an existing file is truncated.
+            initial_capacity: Values preallocated per metric. Set to the
+                expected number of logged values (e.g. the epoch count) to
+                avoid regrowing the arrays.
+        """
+        self._values: Dict[str, np.ndarray] = {}
+        self._sizes: Dict[str, int] = {}
         self.epochs: List[int] = []
-        self.timestamps: List[float] = []
+        self.initial_capacity = max(1, initial_capacity)
+        # Monotonic log times in nanoseconds, one per logged value
+        self._timestamps = np.empty(self.initial_capacity, dtype=np.int64)
+        self._num_logged = 0
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self.best_metrics: Dict[str, Dict[str, Any]] = {}
         
-    def log(self, metric_name: str, value: float, epoch: Optional[int] = None):
+        self.history_path = history_path
+        self._history = open(history_path, 'wb', buffering=1 << 16) if history_path else None
+        self._metric_ids: Dict[str, int] = {}
+        self._is_loss: Dict[str, bool] = {}
+        # Mirrors epochs for O(1) membership checks; epochs keeps the order
+        self._epoch_set: Set[int] = set()
+        
+    def log(
+        self,
+        metric_name: str,
+        value: float,
+        epoch: Optional[int] = None,
+        track_best: bool = True
+    ):
         """
         Log a metric value.
         
         Args:
             metric_name: Name of the metric
-            value: Metric value
+            value: Metric value; anything float() accepts, e.g. a Python or
+                NumPy number or a one-element tensor
             epoch: Optional epoch number
+            track_best: Update best-value and improvement tracking. Disable
+                for metrics that never need get_best/check_improvement.
+        
+        Raises:
+            TypeError: If value is not a number (including None)
         """
-        if metric_name not in self.metrics:
-            self.metrics[metric_name] = []
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise TypeError(
+                f"Metric '{metric_name}' must be a number, got {type(value).__name__}"
+            ) from None
+        
+        arr = self._values.get(metric_name)
+        if arr is None:
+            arr = self._values[metric_name] = np.empty(self.initial_capacity)
+            self._sizes[metric_name] = 0
+            self._is_loss[metric_name] = _is_loss_name(metric_name)
+        
+        n = self._sizes[metric_name]
+        if n == len(arr):
+            # Grow by 1.5x to amortize reallocation
+            grown = np.empty(len(arr) + max(1, len(arr) // 2))
+            grown[:n] = arr
+            arr = self._values[metric_name] = grown
+        
+        arr[n] = value
+        self._sizes[metric_name] = n + 1
         
-        self.metrics[metric_name].append(value)
-        self.timestamps.append(time.time())
+        k = self._num_logged
+        if k == len(self._timestamps):
+            self._timestamps = np.resize(self._timestamps, 2 * k)
+        self._timestamps[k] = time.monotonic_ns()
+        self._num_logged = k + 1
         
-        if epoch is not None and epoch not in self.epochs:
+        if self._history is not None:
+            self._write_history(metric_name, value, epoch)
+        
+        if epoch is not None and epoch not in self._epoch_set:
+            self._epoch_set.add(epoch)
             self.epochs.append(epoch)
         
         # Track best metrics
-        self._update_best_metric(metric_name, value, epoch)
+        if track_best:
+            self._update_best_metric(metric_name, value, epoch)
+    
+    def reserve(self, count: int):
+        """
+        Make room for `count` more values per metric without regrowing.
+        
+        Applies to metrics already logged and to those logged later.
+        
+        Args:
+            count: Number of values each metric is expected to receive
+        """
+        self.initial_capacity = max(self.initial_capacity, count)
+        for metric_name, arr in self._values.items():
+            n = self._sizes[metric_name]
+            if len(arr) < n + count:
+                grown = np.empty(n + count)
+                grown[:n] = arr[:n]
+                self._values[metric_name] = grown
+    
+    def _write_history(self, metric_name: str, value: float, epoch: Optional[int]):
+        """Append one record to the history file."""
+        metric_id = self._metric_ids.get(metric_name)
+        if metric_id is None:
+            metric_id = self._metric_ids[metric_name] = len(self._metric_ids)
+            with open(f"{self.history_path}.json", 'w') as f:
+                json.dump(list(self._metric_ids), f)
+        
+        self._history.write(HISTORY_RECORD.pack(
+            -1 if epoch is None else epoch, metric_id, value
+        ))
+    
+    def flush(self):
+        """Flush buffered history records to disk."""
+        if self._history is not None:
+            self._history.flush()
+    
+    def close(self):
+        """Close the history file, if any."""
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+    
+    @staticmethod
+    def read_history(history_path: str) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Read a history file written by a tracker.
+        
+        Args:
+            history_path: Path passed to MetricTracker(history_path=...)
+        
+        Returns:
+            Dictionary mapping metric names to {'epochs', 'values'} arrays
+        """
+        with open(f"{history_path}.json") as f:
+            names = json.load(f)
+        
+        records = np.fromfile(history_path, dtype=HISTORY_DTYPE)
+        history = {}
+        for metric_id, name in enumerate(names):
+            rows = records[records['metric'] == metric_id]
+            history[name] = {'epochs': rows['epoch'], 'values': rows['value']}
+        return history
     
     def _update_best_metric(self, metric_name: str, value: float, epoch: Optional[int]):
         """Update best metric tracking."""
+        # Position of this value in the metric's array
+        index = self._sizes[metric_name] - 1
+        
         if metric_name not in self.best_metrics:
             self.best_metrics[metric_name] = {
                 'value': value,
                 'epoch': epoch,
+                'index': index,
                 'improved': True
             }
             return
         
-        # Assume lower is better for loss, higher is better for accuracy/precision/etc
-        is_loss = 'loss' in metric_name.lower() or 'error' in metric_name.lower()
-        
         current_best = self.best_metrics[metric_name]['value']
-        improved = value < current_best if is_loss else value > current_best
+        if self._is_loss[metric_name]:
+            improved = value < current_best
+        else:
+            improved = value > current_best
         
         if improved:
             self.best_metrics[metric_name] = {
                 'value': value,
                 'epoch': epoch,
+                'index': index,
                 'improved': True
             }
         else:
             self.best_metrics[metric_name]['improved'] = False
     
+    def is_loss(self, metric_name: str) -> bool:
+        """Check whether lower values of a metric are better."""
+        is_loss = self._is_loss.get(metric_name)
+        if is_loss is None:
+            return _is_loss_name(metric_name)
+        return is_loss
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Monotonic time (ns) of every logged value, in logging order."""
+        return self._timestamps[:self._num_logged]
+    
+    @property
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """Logged values for every metric, as array views."""
+        return {name: arr[:self._sizes[name]] for name, arr in self._values.items()}
+    
     def get_latest(self, metric_name: str) -> Optional[float]:
         """Get latest value for a metric."""
-        if metric_name in self.metrics and self.metrics[metric_name]:
-            return self.metrics[metric_name][-1]
+        n = self._sizes.get(metric_name, 0)
+        if n:
+            return float(self._values[metric_name][n - 1])
         return None
     
+    def get_array(self, metric_name: str) -> np.ndarray:
+        """Get all values for a metric as an array view (no copy)."""
+        if metric_name not in self._values:
+            return np.empty(0)
+        return self._values[metric_name][:self._sizes[metric_name]]
+    
     def get_all(self, metric_name: str) -> List[float]:
         """Get all values for a metric."""
-        return self.metrics.get(metric_name, [])
+        return self.get_array(metric_name).tolist()
     
     def get_best(self, metric_name: str) -> Optional[Dict[str, Any]]:
         """Get best value for a metric."""
@@ -76,10 +278,10 @@ class MetricTracker:
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of all metrics."""
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = (time.monotonic_ns() - self._start_ns) / 1e9
         
         summary = {
-            'total_metrics': len(self.metrics),
+            'total_metrics': len(self._values),
             'total_epochs': len(self.epochs),
             'elapsed_time': elapsed_time,
             'elapsed_time_formatted': self._format_time(elapsed_time),
@@ -87,11 +289,11 @@ class MetricTracker:
         }
         
         for metric_name, values in self.metrics.items():
-            if not values:
+            if not len(values):
                 continue
                 
             summary['metrics'][metric_name] = {
-                'latest': values[-1],
+                'latest': float(values[-1]),
                 'best': self.best_metrics.get(metric_name, {}).get('value'),
                 'best_epoch': self.best_metrics.get(metric_name, {}).get('epoch'),
                 'count': len(values)
@@ -1,54 +1,132 @@
 """System information utilities (GPU, CPU, memory)."""
+import csv
+import functools
 import platform
+import shutil
+import subprocess
 from typing import Dict, List, Any, Optional
 
-try:
-    import GPUtil
-    GPU_AVAILABLE = True
-except ImportError:
-    GPU_AVAILABLE = False
+# GPUs are queried straight from nvidia-smi, in one call for all devices
+NVIDIA_SMI = shutil.which("nvidia-smi")
+GPU_AVAILABLE = NVIDIA_SMI is not None
+
+# Bytes per GB, for memory sizes
+_GB = 1024 ** 3
+
+GPU_QUERY_FIELDS = (
+    "index", "name", "memory.total", "memory.used", "memory.free",
+    "utilization.gpu", "temperature.gpu",
+)
 
 try:
     import psutil
     PSUTIL_AVAILABLE = True
+    # Start CPU sampling so later non-blocking cpu_percent() calls report
+    # usage since the previous call instead of blocking to measure it
+    psutil.cpu_percent(interval=None)
 except ImportError:
     PSUTIL_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=None)
+def _platform_info() -> Dict[str, str]:
+    """
+    Platform details, looked up once on first use.
+    
+    They don't change while the process runs, and platform.processor()
+    may shell out to `uname -p`.
+    """
+    return {
+        'processor': platform.processor(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'version': platform.version(),
+        'python_version': platform.python_version(),
+    }
+
+
+def _parse_number(value: str) -> Optional[float]:
+    """Parse an nvidia-smi field, or None if it isn't a number (e.g. "[N/A]")."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _format_reading(value: Optional[float], spec: str = "", unit: str = "") -> str:
+    """Format a GPU reading, or "N/A" if the GPU didn't report it."""
+    return "N/A" if value is None else f"{value:{spec}}{unit}"
+
+
 class SystemInfo:
     """Collects system information for training context."""
     
+    # Only static methods; instances carry no state
+    __slots__ = ()
+    
     @staticmethod
     def get_gpu_info() -> List[Dict[str, Any]]:
         """
         Get GPU information.
         
         Returns:
-            List of GPU information dictionaries
+            List of GPU information dictionaries with memory in MB,
+            utilization in percent and temperature in °C; readings the GPU
+            doesn't report are None
         """
         if not GPU_AVAILABLE:
             return []
         
         try:
-            gpus = GPUtil.getGPUs()
             gpu_info = []
             
-            for gpu in gpus:
+            for gpu in SystemInfo._query_gpus():
+                memory_total = _parse_number(gpu['memory.total'])
+                memory_used = _parse_number(gpu['memory.used'])
                 gpu_info.append({
-                    'id': gpu.id,
-                    'name': gpu.name,
-                    'memory_total': f"{gpu.memoryTotal} MB",
-                    'memory_used': f"{gpu.memoryUsed} MB",
-                    'memory_free': f"{gpu.memoryFree} MB",
-                    'memory_util': f"{gpu.memoryUtil * 100:.1f}%",
-                    'gpu_util': f"{gpu.load * 100:.1f}%",
-                    'temperature': f"{gpu.temperature}°C" if gpu.temperature else "N/A"
+                    'id': int(gpu['index']),
+                    'name': gpu['name'],
+                    'memory_total_mb': memory_total,
+                    'memory_used_mb': memory_used,
+                    'memory_free_mb': _parse_number(gpu['memory.free']),
+                    'memory_util': (
+                        memory_used / memory_total * 100
+                        if memory_used is not None and memory_total
+                        else None
+                    ),
+                    'gpu_util': _parse_number(gpu['utilization.gpu']),
+                    'temperature': _parse_number(gpu['temperature.gpu'])
                 })
             
             return gpu_info
         except Exception as e:
             return [{'error': str(e)}]
     
+    @staticmethod
+    def _query_gpus() -> List[Dict[str, str]]:
+        """
+        Query all GPUs with a single nvidia-smi call.
+        
+        Returns:
+            One dictionary per GPU mapping GPU_QUERY_FIELDS to raw values
+        """
+        result = subprocess.run(
+            [
+                NVIDIA_SMI,
+                f"--query-gpu={','.join(GPU_QUERY_FIELDS)}",
+                "--format=csv,noheader,nounits",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            check=True
+        )
+        return [
+            dict(zip(GPU_QUERY_FIELDS, (field.strip() for field in row)))
+            for row in csv.reader(result.stdout.splitlines())
+            if row
+        ]
+    
     @staticmethod
     def get_cpu_info() -> Dict[str, Any]:
         """
@@ -58,15 +136,15 @@ class SystemInfo:
             Dictionary with CPU information
         """
         cpu_info = {
-            'processor': platform.processor(),
-            'architecture': platform.machine(),
+            'processor': _platform_info()['processor'],
+            'architecture': _platform_info()['machine'],
         }
         
         if PSUTIL_AVAILABLE:
             try:
                 cpu_info['cpu_count'] = psutil.cpu_count(logical=False)
                 cpu_info['cpu_count_logical'] = psutil.cpu_count(logical=True)
-                cpu_info['cpu_percent'] = f"{psutil.cpu_percent(interval=1)}%"
+                cpu_info['cpu_percent'] = f"{psutil.cpu_percent(interval=None)}%"
             except Exception:
                 pass
         
@@ -78,7 +156,7 @@ class SystemInfo:
         Get memory information.
         
         Returns:
-            Dictionary with memory information
+            Dictionary with memory sizes in GB and usage in percent
         """
         if not PSUTIL_AVAILABLE:
             return {}
@@ -86,10 +164,10 @@ class SystemInfo:
         try:
             mem = psutil.virtual_memory()
             return {
-                'total': f"{mem.total / (1024**3):.2f} GB",
-                'available': f"{mem.available / (1024**3):.2f} GB",
-                'used': f"{mem.used / (1024**3):.2f} GB",
-                'percent': f"{mem.percent}%"
+                'total_gb': mem.total / _GB,
+                'available_gb': mem.available / _GB,
+                'used_gb': mem.used / _GB,
+                'percent': mem.percent
             }
         except Exception as e:
             return {'error': str(e)}
@@ -103,9 +181,9 @@ class SystemInfo:
             Dictionary with all system information
         """
         return {
-            'platform': platform.system(),
-            'platform_version': platform.version(),
-            'python_version': platform.python_version(),
+            'platform': _platform_info()['system'],
+            'platform_version': _platform_info()['version'],
+            'python_version': _platform_info()['python_version'],
             'cpu': SystemInfo.get_cpu_info(),
             'memory': SystemInfo.get_memory_info(),
             'gpu': SystemInfo.get_gpu_info()
@@ -140,8 +218,8 @@ class SystemInfo:
         
         # Memory info
         mem = info.get('memory', {})
-        if mem and 'total' in mem:
-            lines.append(f"  Memory: {mem['used']} / {mem['total']} ({mem['percent']})")
+        if mem and 'total_gb' in mem:
+            lines.append(f"  Memory: {mem['used_gb']:.2f} GB / {mem['total_gb']:.2f} GB ({mem['percent']}%)")
         
         # GPU info
         if include_gpu:
@@ -150,8 +228,12 @@ class SystemInfo:
                 lines.append(f"  GPUs: {len(gpus)}")
                 for i, gpu in enumerate(gpus):
                     lines.append(f"    GPU {i}: {gpu['name']}")
-                    lines.append(f"      Memory: {gpu['memory_used']} / {gpu['memory_total']} ({gpu['memory_util']})")
-                    lines.append(f"      Utilization: {gpu['gpu_util']}")
+                    lines.append(
+                        f"      Memory: {_format_reading(gpu['memory_used_mb'], unit=' MB')} / "
+                        f"{_format_reading(gpu['memory_total_mb'], unit=' MB')} "
+                        f"({_format_reading(gpu['memory_util'], '.1f', '%')})"
+                    )
+                    lines.append(f"      Utilization: {_format_reading(gpu['gpu_util'], '.1f', '%')}")
             elif not gpus:
                 lines.append("  GPUs: None detected")
         
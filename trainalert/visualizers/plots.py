@@ -1,21 +1,171 @@
 """Plot generation for training metrics."""
+import functools
 import io
-from typing import Dict, List, Optional
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
+import threading
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 import numpy as np
 
+from ..utils.metrics import _is_loss_name
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Settings applied while plotting: labels are metric names, never math, so
+# skip mathtext parsing, and let Agg simplify and chunk long line paths
+_PLOT_RC = {
+    'text.parse_math': False,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+# Series longer than this are drawn as plain lines; a marker per point
+# dominates drawing time and just blurs into the line
+MARKER_LIMIT = 1000
+
+# Maximum points drawn per series; a plot is only ~1000 pixels wide, so
+# longer series are decimated for drawing (annotations use the full data)
+PLOT_POINTS = 2000
+
+# Subplot spacing parameters reset to their rcParams defaults on reused figures
+_SPACING_PARAMS = ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+
+# Per-thread figures kept for reuse, keyed by (kind, figsize, rows, cols).
+# Each kind of plot gets its own figures, so figure-level artists such as the
+# overview's suptitle never leak into another kind. Matplotlib artists aren't
+# thread-safe, so threads never share a figure.
+_figures = threading.local()
+
+
+def _downsample(x, y, target: int = PLOT_POINTS):
+    """
+    Decimate a series to about `target` points for drawing.
+    
+    Args:
+        x: X values
+        y: Y values
+        target: Approximate number of points to keep
+    
+    Returns:
+        Tuple of (x, y), unchanged if already short enough
+    """
+    stride = len(y) // target
+    if stride <= 1:
+        return x, y
+    # Keep every stride-th point plus the last, so the line ends where the data does
+    idx = np.arange(0, len(y), stride)
+    if idx[-1] != len(y) - 1:
+        idx = np.append(idx, len(y) - 1)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
+
+
+def _plot_rc(func):
+    """Run a plotting function with _PLOT_RC, leaving global rcParams untouched."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        from matplotlib import rc_context, rcParams
+        
+        # Older matplotlib versions lack some of these settings
+        with rc_context({k: v for k, v in _PLOT_RC.items() if k in rcParams}):
+            return func(*args, **kwargs)
+    return wrapper
+
 
 class PlotGenerator:
     """Generates plots for training metrics."""
     
+    # Resolution of rendered plots; ample for notification thumbnails
+    DPI = 100
+    
     @staticmethod
+    def _new_figure(figsize: tuple) -> "Figure":
+        """
+        Create a figure bound directly to an Agg canvas.
+        
+        Bypasses pyplot so figures are never registered with the global
+        figure manager and don't need to be closed explicitly.
+        
+        Args:
+            figsize: Figure size tuple
+        
+        Returns:
+            New matplotlib Figure
+        """
+        # matplotlib is slow to import, so load it on the first plot
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=figsize, dpi=PlotGenerator.DPI)
+        FigureCanvasAgg(fig)
+        return fig
+    
+    @staticmethod
+    def _get_figure(
+        kind: str,
+        figsize: tuple,
+        rows: int = 1,
+        cols: int = 1
+    ) -> Tuple["Figure", np.ndarray]:
+        """
+        Get a cleared figure and its axes, reusing one from an earlier plot.
+        
+        Building a figure and its axes is the slowest part of a plot, so each
+        layout is created once per thread and its axes are cleared for reuse.
+        
+        Args:
+            kind: Plot kind the figure is drawn for; figures are only reused
+                for the same kind
+            figsize: Figure size tuple
+            rows: Number of subplot rows
+            cols: Number of subplot columns
+        
+        Returns:
+            Tuple of (figure, axes) where axes is a flat array of the
+            subplots in row-major order
+        """
+        cache = getattr(_figures, 'cache', None)
+        if cache is None:
+            cache = _figures.cache = {}
+        
+        key = (kind, tuple(figsize), rows, cols)
+        if key in cache:
+            fig, axes = cache[key]
+            for ax in axes:
+                ax.clear()
+                ax.set_visible(True)
+            # Undo the previous tight_layout so the new one starts from the
+            # same spacing as on a fresh figure
+            from matplotlib import rcParams
+            fig.subplots_adjust(**{
+                param: rcParams[f'figure.subplot.{param}'] for param in _SPACING_PARAMS
+            })
+        else:
+            fig = PlotGenerator._new_figure(figsize)
+            # squeeze=False always gives a 2D array, whatever the layout
+            axes = fig.subplots(rows, cols, squeeze=False).ravel()
+            cache[key] = (fig, axes)
+        return fig, axes
+    
+    @staticmethod
+    def _to_png(fig: "Figure") -> io.BytesIO:
+        """Render a figure to a PNG buffer."""
+        buf = io.BytesIO()
+        # Print straight from the Agg canvas at the figure's own DPI, skipping
+        # savefig's format dispatch and its temporary DPI/color overrides.
+        # Layout is already fitted by tight_layout. Fastest zlib level:
+        # notification plots favour encode speed over size.
+        fig.canvas.print_png(buf, pil_kwargs={'compress_level': 1})
+        buf.seek(0)
+        return buf
+    
+    @staticmethod
+    @_plot_rc
     def create_metric_plot(
         metric_name: str,
         values: List[float],
         epochs: Optional[List[int]] = None,
-        figsize: tuple = (10, 6)
+        figsize: tuple = (10, 6),
+        best_idx: Optional[int] = None
     ) -> io.BytesIO:
         """
         Create a plot for a single metric.
@@ -25,22 +175,26 @@ class PlotGenerator:
             values: List of metric values
             epochs: Optional list of epoch numbers
             figsize: Figure size tuple
+            best_idx: Index of the best value, e.g. the tracker's
+                best_metrics[name]['index']; found by scanning values if omitted
         
         Returns:
             BytesIO object containing the plot image
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, (ax,) = PlotGenerator._get_figure('metric', figsize)
         
-        x_axis = epochs if epochs else list(range(len(values)))
+        x_axis = epochs if epochs else np.arange(len(values))
         
-        ax.plot(x_axis, values, marker='o', linewidth=2, markersize=4)
+        show_markers = len(values) <= MARKER_LIMIT
+        ax.plot(*_downsample(x_axis, values), marker='o' if show_markers else None,
+                linewidth=2, markersize=4)
         ax.set_xlabel('Epoch' if epochs else 'Step', fontsize=12)
         ax.set_ylabel(metric_name.replace('_', ' ').title(), fontsize=12)
         ax.set_title(f'{metric_name.replace("_", " ").title()} Over Time', fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3)
         
         # Add value annotations for first, last, and best points
-        if values:
+        if len(values):
             # First point
             ax.annotate(f'{values[0]:.4f}',
                        xy=(x_axis[0], values[0]),
@@ -58,8 +212,8 @@ class PlotGenerator:
                        bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.5))
             
             # Best point
-            is_loss = 'loss' in metric_name.lower()
-            best_idx = np.argmin(values) if is_loss else np.argmax(values)
+            if best_idx is None:
+                best_idx = np.argmin(values) if _is_loss_name(metric_name) else np.argmax(values)
             ax.annotate(f'Best: {values[best_idx]:.4f}',
                        xy=(x_axis[best_idx], values[best_idx]),
                        xytext=(10, 10),
@@ -67,18 +221,21 @@ class PlotGenerator:
                        fontsize=8,
                        bbox=dict(boxstyle='round,pad=0.3', facecolor='lightblue', alpha=0.7),
                        arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
+            
+            # Without per-point markers, still mark the annotated points
+            if not show_markers:
+                ax.scatter(
+                    [x_axis[0], x_axis[-1], x_axis[best_idx]],
+                    [values[0], values[-1], values[best_idx]],
+                    s=30, zorder=3
+                )
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Save to BytesIO
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-        buf.seek(0)
-        plt.close(fig)
-        
-        return buf
+        return PlotGenerator._to_png(fig)
     
     @staticmethod
+    @_plot_rc
     def create_multi_metric_plot(
         metrics_dict: Dict[str, List[float]],
         epochs: Optional[List[int]] = None,
@@ -103,27 +260,26 @@ class PlotGenerator:
         cols = min(2, n_metrics)
         rows = (n_metrics + cols - 1) // cols
         
-        fig, axes = plt.subplots(rows, cols, figsize=figsize)
-        if n_metrics == 1:
-            axes = [axes]
-        else:
-            axes = axes.flatten() if isinstance(axes, np.ndarray) else [axes]
+        fig, axes = PlotGenerator._get_figure('multi_metric', figsize, rows, cols)
         
         for idx, (metric_name, values) in enumerate(metrics_dict.items()):
             if idx >= len(axes):
                 break
                 
             ax = axes[idx]
-            x_axis = epochs if epochs else list(range(len(values)))
+            x_axis = epochs if epochs else np.arange(len(values))
             
-            ax.plot(x_axis, values, marker='o', linewidth=2, markersize=3)
+            ax.plot(
+                *_downsample(x_axis, values), marker='o' if len(values) <= MARKER_LIMIT else None,
+                linewidth=2, markersize=3
+            )
             ax.set_xlabel('Epoch' if epochs else 'Step', fontsize=10)
             ax.set_ylabel(metric_name.replace('_', ' ').title(), fontsize=10)
             ax.set_title(metric_name.replace('_', ' ').title(), fontsize=11, fontweight='bold')
             ax.grid(True, alpha=0.3)
             
             # Add latest value annotation
-            if values:
+            if len(values):
                 ax.annotate(f'{values[-1]:.4f}',
                            xy=(x_axis[-1], values[-1]),
                            xytext=(5, 5),
@@ -135,18 +291,13 @@ class PlotGenerator:
         for idx in range(n_metrics, len(axes)):
             axes[idx].set_visible(False)
         
-        plt.suptitle('Training Metrics Overview', fontsize=14, fontweight='bold', y=1.00)
-        plt.tight_layout()
+        fig.suptitle('Training Metrics Overview', fontsize=14, fontweight='bold', y=1.00)
+        fig.tight_layout()
         
-        # Save to BytesIO
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-        buf.seek(0)
-        plt.close(fig)
-        
-        return buf
+        return PlotGenerator._to_png(fig)
     
     @staticmethod
+    @_plot_rc
     def create_comparison_plot(
         train_values: List[float],
         val_values: List[float],
@@ -167,12 +318,15 @@ class PlotGenerator:
         Returns:
             BytesIO object containing the plot image
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, (ax,) = PlotGenerator._get_figure('comparison', figsize)
         
-        x_axis = epochs if epochs else list(range(len(train_values)))
+        x_axis = epochs if epochs else np.arange(len(train_values))
         
-        ax.plot(x_axis, train_values, marker='o', linewidth=2, markersize=4, label='Train', color='blue')
-        ax.plot(x_axis, val_values, marker='s', linewidth=2, markersize=4, label='Validation', color='orange')
+        show_markers = max(len(train_values), len(val_values)) <= MARKER_LIMIT
+        ax.plot(*_downsample(x_axis, train_values), marker='o' if show_markers else None,
+                linewidth=2, markersize=4, label='Train', color='blue')
+        ax.plot(*_downsample(x_axis, val_values), marker='s' if show_markers else None,
+                linewidth=2, markersize=4, label='Validation', color='orange')
         
         ax.set_xlabel('Epoch' if epochs else 'Step', fontsize=12)
         ax.set_ylabel(metric_name.replace('_', ' ').title(), fontsize=12)
@@ -180,12 +334,6 @@ class PlotGenerator:
         ax.grid(True, alpha=0.3)
         ax.legend(fontsize=11)
         
-        plt.tight_layout()
-        
-        # Save to BytesIO
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-        buf.seek(0)
-        plt.close(fig)
+        fig.tight_layout()
         
-        return buf
\ No newline at end of file
+        return PlotGenerator._to_png(fig)
\ No newline at end of file